@@ -0,0 +1,64 @@
+"""
+Micro-benchmark: default FastAPI/Pydantic JSON path vs the fast wire path (api/wire.py).
+
+Run from ai/: python bench/bench_wire.py [items]
+Measures decode + validate for an ingest payload and encoding of a query response.
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+
+from helly_ai.api import wire
+from helly_ai.api.schemas import IngestRequest
+from helly_ai.domain.protocols import FeedbackRef, QueryResponse
+
+
+def bench(name: str, fn: Callable[[], object], rounds: int = 20) -> float:
+    fn()
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    print(f"  {name:<34} {best * 1000:8.2f} ms")
+    return best
+
+
+def main(n: int) -> None:
+    payload = {
+        "team_member_ref": "max",
+        "items": [
+            {"id": f"id-{i}", "content": f"Max improved the API performance, note {i}. " * 3, "created_at": "2024-06-01T10:00:00Z"}
+            for i in range(n)
+        ],
+        "wipe_existing": False,
+    }
+    as_json = json.dumps(payload).encode()
+    print(f"ingest decode+validate, {n} items ({len(as_json) / 1e6:.1f} MB JSON)")
+    base = bench("json + pydantic (current)", lambda: IngestRequest.model_validate(json.loads(as_json)))
+    fast = bench("json + columnar", lambda: wire.parse_ingest(wire.decode_body(as_json, "application/json")))
+    print(f"  speedup {base / fast:.1f}x")
+    if wire.msgpack is not None:
+        packed = wire.msgpack.packb(payload)
+        bench(f"msgpack + columnar ({len(packed) / 1e6:.1f} MB)", lambda: wire.parse_ingest(wire.decode_body(packed, "application/msgpack")))
+
+    resp = QueryResponse(
+        answer="Discuss API performance. " * 20,
+        citations=[FeedbackRef(id=f"id-{i}", created_at="2024-06-01T10:00:00Z", snippet="snippet " * 30) for i in range(50)],
+        meta={"member_id": "max"},
+    )
+    print("query response encode, 50 citations (x100)")
+    base = bench("jsonable_encoder + json (current)", lambda: [json.dumps(jsonable_encoder(resp)).encode() for _ in range(100)])
+    fast = bench("model_dump + orjson/json", lambda: [wire.encode_response(resp.model_dump(), None) for _ in range(100)])
+    print(f"  speedup {base / fast:.1f}x")
+    if wire.msgpack is not None:
+        bench("model_dump + msgpack", lambda: [wire.encode_response(resp.model_dump(), "application/msgpack") for _ in range(100)])
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
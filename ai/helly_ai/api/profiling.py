@@ -0,0 +1,207 @@
+"""
+Opt-in sampling profiler for individual requests.
+
+A daemon thread snapshots Python stacks (sys._current_frames) at a fixed interval while a
+selected request runs, keeping only the request's own threads: the event loop while it is
+running the request's task, and worker threads while they run a function wrapped in traced()
+(routers wrap what they hand to SingleFlight / asyncio.to_thread). Stacks are written as
+folded stacks ("frame;frame;frame count" per line), which flamegraph.pl, speedscope and
+inferno read directly. Requests are selected by PROFILE_SAMPLE_RATE or the X-Helly-Profile
+header; one request is profiled at a time. The middleware is only installed when
+PROFILE_ENABLED is set, so the disabled path costs nothing.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Set
+
+PROFILE_HEADER = "x-helly-profile"
+_PACKAGE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_NAME_RE = re.compile(r"^[\w.-]+\.folded$")
+
+
+class _Session:
+    """Threads belonging to one profiled request."""
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.task = asyncio.current_task()
+        self.loop_thread = threading.get_ident()
+        self.workers: Set[int] = set()
+
+
+_session: contextvars.ContextVar[Optional[_Session]] = contextvars.ContextVar("helly_profile_session", default=None)
+
+
+def traced(fn: Callable) -> Callable:
+    """Wrap a function run off the event loop so a profiled request samples the worker thread running it.
+
+    asyncio.to_thread copies the caller's context, so the session is visible in the worker.
+    Outside a profiled request this is a plain call.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        session = _session.get()
+        tid = threading.get_ident()
+        if session is None or tid in session.workers:
+            return fn(*args, **kwargs)
+        session.workers.add(tid)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            session.workers.discard(tid)
+
+    return wrapper
+
+
+class StackSampler:
+    def __init__(self, session: _Session, interval_s: float = 0.005, focus_dir: str = _PACKAGE_DIR):
+        self._session = session
+        self._interval_s = interval_s
+        self._focus_dir = focus_dir
+        self._stacks: Counter = Counter()
+        self._labels: Dict[object, str] = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="profile-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        self._stop.set()
+        self._thread.join()
+        return self._stacks
+
+    def _label(self, code) -> str:
+        label = self._labels.get(code)
+        if label is None:
+            path = code.co_filename
+            short = os.path.relpath(path, os.path.dirname(self._focus_dir)) if path.startswith(self._focus_dir) else os.path.basename(path)
+            label = f"{code.co_name} ({short}:{code.co_firstlineno})".replace(";", ":")
+            self._labels[code] = label
+        return label
+
+    def _threads(self) -> Set[int]:
+        session = self._session
+        tids = set(session.workers)
+        # The loop thread is shared with every other request; count it only while it runs ours
+        if asyncio.current_task(session.loop) is session.task:
+            tids.add(session.loop_thread)
+        return tids
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_s):
+            tids = self._threads()
+            if not tids:
+                continue
+            for tid, frame in sys._current_frames().items():
+                if tid not in tids:
+                    continue
+                codes = []
+                while frame is not None:
+                    codes.append(frame.f_code)
+                    frame = frame.f_back
+                self._stacks[";".join(self._label(c) for c in reversed(codes))] += 1
+
+
+class ProfileStore:
+    """Folded-stack profiles in a local directory, newest `keep` retained."""
+
+    def __init__(self, directory: str, keep: int = 50):
+        self._dir = directory
+        self._keep = keep
+
+    def save(self, name: str, stacks: Counter) -> None:
+        os.makedirs(self._dir, exist_ok=True)
+        tmp = os.path.join(self._dir, f".{name}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        os.replace(tmp, os.path.join(self._dir, name))
+        for old in self.list()[self._keep:]:
+            try:
+                os.remove(os.path.join(self._dir, old["name"]))
+            except FileNotFoundError:
+                pass
+
+    def list(self) -> List[dict]:
+        if not os.path.isdir(self._dir):
+            return []
+        entries = []
+        for name in os.listdir(self._dir):
+            if _NAME_RE.match(name):
+                st = os.stat(os.path.join(self._dir, name))
+                entries.append({"name": name, "size": st.st_size, "created_at": st.st_mtime})
+        return sorted(entries, key=lambda e: (e["created_at"], e["name"]), reverse=True)
+
+    def read(self, name: str) -> Optional[str]:
+        path = os.path.join(self._dir, name)
+        if not _NAME_RE.match(name) or not os.path.isfile(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+
+
+class ProfilingMiddleware:
+    """Pure ASGI middleware; profiled responses carry the profile name in X-Helly-Profile-Id."""
+
+    def __init__(
+        self,
+        app,
+        store: ProfileStore,
+        sample_rate: float = 0.0,
+        interval_s: float = 0.005,
+        path_prefix: str = "/v1/",
+        focus_dir: str = _PACKAGE_DIR,
+    ):
+        self.app = app
+        self._store = store
+        self._sample_rate = sample_rate
+        self._interval_s = interval_s
+        self._path_prefix = path_prefix
+        self._focus_dir = focus_dir
+        self._busy = threading.Lock()
+
+    def _wanted(self, scope) -> bool:
+        path = scope.get("path", "")
+        if not path.startswith(self._path_prefix) or path.startswith(self._path_prefix + "admin/"):
+            return False
+        for key, value in scope.get("headers", []):
+            if key == PROFILE_HEADER.encode() and value.lower() in (b"1", b"true", b"yes"):
+                return True
+        return self._sample_rate > 0 and random.random() < self._sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._wanted(scope) or not self._busy.acquire(blocking=False):
+            await self.app(scope, receive, send)
+            return
+        slug = re.sub(r"[^\w]+", "_", scope["path"]).strip("_")
+        name = f"{time.strftime('%Y%m%dT%H%M%S')}-{scope['method'].lower()}-{slug}-{uuid.uuid4().hex[:8]}.folded"
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", []), (b"x-helly-profile-id", name.encode())]}
+            await send(message)
+
+        session = _Session()
+        token = _session.set(session)
+        sampler = StackSampler(session, self._interval_s, self._focus_dir)
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            stacks = sampler.stop()
+            _session.reset(token)
+            self._busy.release()
+            await asyncio.to_thread(self._store.save, name, stacks)
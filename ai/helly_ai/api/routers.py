@@ -1,10 +1,20 @@
-from fastapi import APIRouter
-from pydantic import BaseModel
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
 from typing import List, Optional
+import asyncio
 import logging
+import os
+import tempfile
 
 from helly_ai.application.container import make_rag_pipeline, make_member_resolution_service
-from helly_ai.domain.protocols import FeedbackItem, QueryResponse
+from helly_ai.application.keys import query_key, resolve_key
+from helly_ai.application.singleflight import SingleFlight
+from helly_ai.api.profiling import ProfileStore, traced
+from helly_ai.api.schemas import IngestRequest, QueryRequest, request_body
+from helly_ai.api.wire import encode_response, parse_ingest, read_payload
+from helly_ai.domain.protocols import QueryResponse
 from helly_ai.domain.resolution import ResolveCandidate, ResolveResponse
 
 logger = logging.getLogger("helly_ai.api")
@@ -12,31 +22,32 @@ logger = logging.getLogger("helly_ai.api")
 router = APIRouter(prefix="/v1")
 _pipeline = make_rag_pipeline()
 _resolver = make_member_resolution_service()
+# Identical concurrent queries/resolutions share one computation
+_query_flight = SingleFlight()
+_resolve_flight = SingleFlight()
 logger.info("RAG pipeline and resolver initialized")
 
-class IngestRequest(BaseModel):
-    team_member_ref: str
-    items: List[FeedbackItem]
-    from_: Optional[str] = None
-    to: Optional[str] = None
-    wipe_existing: bool = True
+# Ingest/query bodies are decoded by Content-Type (JSON or msgpack) and answered per Accept; see api/wire.py.
+# The handlers take the raw Request, so the body schemas are declared explicitly for OpenAPI.
 
-class QueryRequest(BaseModel):
-    text: str
-    from_: Optional[str] = None
-    to: Optional[str] = None
-    person_hint: Optional[str] = None
-
-@router.post("/ingest/member-corpus", status_code=202)
-async def ingest_member_corpus(req: IngestRequest):
-    logger.info("/ingest/member-corpus member_ref=%s items=%d", req.team_member_ref, len(req.items))
-    _pipeline.ingest(member_ref=req.team_member_ref, items=req.items, time_range=(req.from_, req.to))
-    return {"status": "accepted"}
-
-@router.post("/query", response_model=QueryResponse)
-async def query(req: QueryRequest):
+@router.post("/ingest/member-corpus", status_code=202, openapi_extra=request_body(IngestRequest))
+async def ingest_member_corpus(request: Request):
+    req = parse_ingest(await read_payload(request))
+    logger.info("/ingest/member-corpus member_ref=%s items=%d", req["team_member_ref"], len(req["items"]))
+    _pipeline.ingest(member_ref=req["team_member_ref"], items=req["items"], time_range=(req["from_"], req["to"]))
+    return encode_response({"status": "accepted"}, request.headers.get("accept"), status_code=202)
+
+@router.post("/query", response_model=QueryResponse, openapi_extra=request_body(QueryRequest))
+async def query(request: Request):
+    try:
+        req = QueryRequest.model_validate(await read_payload(request))
+    except ValidationError as e:
+        raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)])
     logger.info("/query text_len=%d person_hint=%s", len(req.text or ""), req.person_hint)
-    return _pipeline.answer(question=req.text, time_range=(req.from_, req.to), person_hint=req.person_hint)
+    time_range = (req.from_, req.to)
+    key = query_key(req.text, time_range, req.person_hint)
+    resp = await _query_flight.do(key, traced(_pipeline.answer), question=req.text, time_range=time_range, person_hint=req.person_hint)
+    return encode_response(resp.model_dump(), request.headers.get("accept"))
 
 class ResolveRequest(BaseModel):
     text: str
@@ -47,6 +58,85 @@ class ResolveRequest(BaseModel):
 @router.post("/resolve/member", response_model=ResolveResponse)
 async def resolve_member(req: ResolveRequest):
     logger.info("/resolve/member candidates=%d", len(req.candidates or []))
-    return _resolver.resolve(text=req.text, candidates=req.candidates, context=req.context)
+    key = resolve_key(req.text, req.candidates, req.context)
+    return await _resolve_flight.do(key, traced(_resolver.resolve), text=req.text, candidates=req.candidates, context=req.context)
+
+
+@router.get("/admin/stats")
+async def admin_stats():
+    return {
+        "singleflight": {
+            "query": _query_flight.stats(),
+            "resolve": _resolve_flight.stats(),
+        },
+        "resolve_cache": _resolver.stats(),
+    }
+
+
+
+
+# ----- Vector index snapshots -----
+
+_SPOOL_MAX = 64 * 1024 * 1024
+
+
+def _snapshot_store():
+    store = getattr(_pipeline, "vector_store", None)
+    if not hasattr(store, "export_snapshot"):
+        raise HTTPException(status_code=501, detail="Vector store does not support snapshots")
+    return store
+
+
+@router.get("/admin/snapshot")
+async def export_snapshot(compress: bool = True):
+    store = _snapshot_store()
+    buf = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX)
+    count = await asyncio.to_thread(traced(store.export_snapshot), buf, compress)
+    buf.seek(0)
+    logger.info("/admin/snapshot export items=%d compress=%s", count, compress)
+
+    def _chunks():
+        try:
+            while chunk := buf.read(1024 * 1024):
+                yield chunk
+        finally:
+            buf.close()
+
+    return StreamingResponse(
+        _chunks(),
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": 'attachment; filename="helly-vectors.snap"', "X-Item-Count": str(count)},
+    )
+
+
+@router.post("/admin/snapshot")
+async def import_snapshot(request: Request):
+    store = _snapshot_store()
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX) as buf:
+        async for chunk in request.stream():
+            buf.write(chunk)
+        buf.seek(0)
+        try:
+            count = await asyncio.to_thread(traced(store.import_snapshot), buf)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    logger.info("/admin/snapshot import items=%d", count)
+    return {"status": "imported", "items": count}
+
+
+# ----- Request profiles (see api/profiling.py; written only when PROFILE_ENABLED) -----
+
+_profiles = ProfileStore(os.getenv("PROFILE_DIR", ".profiles"))
+
+
+@router.get("/admin/profiles")
+async def list_profiles():
+    return {"profiles": _profiles.list()}
 
 
+@router.get("/admin/profiles/{name}", response_class=PlainTextResponse)
+async def get_profile(name: str):
+    folded = _profiles.read(name)
+    if folded is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return folded
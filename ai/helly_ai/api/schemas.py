@@ -0,0 +1,53 @@
+"""
+Request bodies for the fast wire endpoints (see api/wire.py).
+The handlers read the raw request, so these models document the contract in OpenAPI
+(via request_body) and are what JSON and msgpack payloads must match.
+"""
+from __future__ import annotations
+
+from typing import Any, List, Optional, Type
+
+from pydantic import BaseModel
+
+from helly_ai.domain.protocols import FeedbackItem
+
+
+class IngestRequest(BaseModel):
+    team_member_ref: str
+    items: List[FeedbackItem]
+    from_: Optional[str] = None
+    to: Optional[str] = None
+    wipe_existing: bool = True
+
+
+class QueryRequest(BaseModel):
+    text: str
+    from_: Optional[str] = None
+    to: Optional[str] = None
+    person_hint: Optional[str] = None
+
+
+def _inline_refs(node: Any, defs: dict) -> Any:
+    if isinstance(node, dict):
+        ref = node.get("$ref", "")
+        if ref.startswith("#/$defs/"):
+            return _inline_refs(defs[ref[len("#/$defs/"):]], defs)
+        return {k: _inline_refs(v, defs) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_inline_refs(v, defs) for v in node]
+    return node
+
+
+def request_body(model: Type[BaseModel]) -> dict:
+    """openapi_extra declaring model as the JSON/msgpack request body (nested $defs inlined)."""
+    schema = model.model_json_schema()
+    schema = _inline_refs(schema, schema.pop("$defs", {}))
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/json": {"schema": schema},
+                "application/msgpack": {"schema": schema},
+            },
+        }
+    }
@@ -0,0 +1,126 @@
+"""
+Fast wire path for high-volume endpoints (ingest/query).
+
+- Request bodies are decoded by Content-Type: JSON (orjson when installed) or msgpack.
+- Item batches are validated column-wise in plain Python (one type scan per field) and
+  returned as lightweight FeedbackRow tuples instead of one Pydantic model per row;
+  rows may be sent as a list of objects or as columns
+  ({"id": [...], "content": [...], "created_at": [...]}).
+- Responses are encoded by Accept: msgpack when asked for, otherwise JSON (orjson when installed).
+
+Plain JSON clients keep the same contract; invalid payloads still get a 422 in FastAPI's format.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
+from pydantic import ValidationError
+
+from helly_ai.api.schemas import IngestRequest
+from helly_ai.domain.protocols import FeedbackRow
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dep
+    orjson = None  # type: ignore
+
+try:
+    import msgpack  # type: ignore
+except Exception:  # pragma: no cover - optional dep
+    msgpack = None  # type: ignore
+
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+_ITEM_FIELDS = ("id", "content", "created_at")
+
+
+def _media_type(header: Optional[str]) -> str:
+    return (header or "").split(";")[0].strip().lower()
+
+
+def decode_body(body: bytes, content_type: Optional[str]) -> Any:
+    media = _media_type(content_type)
+    if media in MSGPACK_TYPES:
+        if msgpack is None:
+            raise HTTPException(status_code=415, detail="msgpack not supported; install 'msgpack'")
+        try:
+            return msgpack.unpackb(body, raw=False)
+        except Exception as e:
+            raise RequestValidationError([_error("msgpack_invalid", ("body",), f"Invalid msgpack: {e}")])
+    if media in ("", "application/json") or media.endswith("+json"):
+        try:
+            return orjson.loads(body) if orjson is not None else json.loads(body)
+        except ValueError as e:
+            raise RequestValidationError([_error("json_invalid", ("body",), f"JSON decode error: {e}")])
+    raise HTTPException(status_code=415, detail=f"Unsupported Content-Type {media!r}")
+
+
+async def read_payload(request: Request) -> Any:
+    return decode_body(await request.body(), request.headers.get("content-type"))
+
+
+def _error(kind: str, loc: tuple, msg: str, value: Any = None) -> dict:
+    return {"type": kind, "loc": loc, "msg": msg, "input": value}
+
+
+def parse_items(raw: Any) -> List[FeedbackRow]:
+    """Validate a batch of feedback items column-wise; rows or columns are accepted."""
+    loc = ("body", "items")
+    if isinstance(raw, dict):
+        columns = [raw.get(f) for f in _ITEM_FIELDS]
+        missing = [f for f, col in zip(_ITEM_FIELDS, columns) if not isinstance(col, list)]
+        if missing:
+            raise RequestValidationError([_error("list_type", loc + (f,), "Input should be a valid list", raw.get(f)) for f in missing])
+        if len({len(c) for c in columns}) != 1:
+            raise RequestValidationError([_error("value_error", loc, "Item columns must have equal lengths", {f: len(c) for f, c in zip(_ITEM_FIELDS, columns)})])
+    elif isinstance(raw, list):
+        if not all(type(row) is dict for row in raw):
+            bad = next(i for i, row in enumerate(raw) if type(row) is not dict)
+            raise RequestValidationError([_error("model_type", loc + (bad,), "Input should be a valid dictionary", raw[bad])])
+        columns = [[row.get(f) for row in raw] for f in _ITEM_FIELDS]
+    else:
+        raise RequestValidationError([_error("list_type", loc, "Input should be a valid list", raw)])
+
+    errors = []
+    for field, col in zip(_ITEM_FIELDS, columns):
+        # Fast path: a single type scan per column; only walk rows to report errors
+        if all(type(v) is str for v in col):
+            continue
+        for i, v in enumerate(col):
+            if v is None:
+                errors.append(_error("missing", loc + (i, field), "Field required"))
+            elif not isinstance(v, str):
+                errors.append(_error("string_type", loc + (i, field), "Input should be a valid string", v))
+    if errors:
+        raise RequestValidationError(errors)
+    return list(map(FeedbackRow._make, zip(*columns)))
+
+
+def parse_ingest(payload: Any) -> Dict[str, Any]:
+    """
+    Validate an ingest payload against IngestRequest; returns its fields with items as FeedbackRow.
+    Scalar fields go through the model so they coerce exactly as before (e.g. "wipe_existing": "false");
+    only items take the column-wise path.
+    """
+    if not isinstance(payload, dict):
+        raise RequestValidationError([_error("model_attributes_type", ("body",), "Input should be a valid dictionary or object", payload)])
+    scalars = {k: v for k, v in payload.items() if k != "items"}
+    if "items" in payload:
+        scalars["items"] = []
+    try:
+        fields = IngestRequest.model_validate(scalars).model_dump(exclude={"items"})
+    except ValidationError as e:
+        raise RequestValidationError([{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)])
+    fields["items"] = parse_items(payload["items"])
+    return fields
+
+
+def encode_response(data: Any, accept: Optional[str], status_code: int = 200) -> Response:
+    if msgpack is not None and any(_media_type(part) in MSGPACK_TYPES for part in (accept or "").split(",")):
+        return Response(msgpack.packb(data, use_bin_type=True), status_code=status_code, media_type="application/msgpack")
+    if orjson is not None:
+        return Response(orjson.dumps(data), status_code=status_code, media_type="application/json")
+    return JSONResponse(data, status_code=status_code)
@@ -11,12 +11,15 @@ from helly_ai.domain.protocols import (
     VectorStore,
     Embedder,
     LLMClient,
+    Reranker,
     RAGPipeline,
     FeedbackItem,
     FeedbackRef,
     QueryResponse,
 )
+from helly_ai.application.caching import TTLCache
 from helly_ai.application.resolution_service import MemberResolutionService
+from helly_ai.application.summary_service import MemberSummaryService, infer_time_range, is_broad_question
 from helly_ai.domain.resolution import ResolveCandidate, ResolveResponse, ResolveHit
 
 # Implementations
@@ -30,6 +33,16 @@ try:
 except Exception:  # pragma: no cover
     LocalSentenceTransformerEmbedder = None  # type: ignore
 
+try:
+    from helly_ai.infrastructure.rerankers.cross_encoder import LocalCrossEncoderReranker
+except Exception:  # pragma: no cover
+    LocalCrossEncoderReranker = None  # type: ignore
+
+try:
+    from helly_ai.infrastructure.summaries.sqlite_store import SqliteSummaryStore
+except Exception:  # pragma: no cover
+    SqliteSummaryStore = None  # type: ignore
+
 try:
     from helly_ai.infrastructure.llm.openrouter_client import OpenRouterLLMClient
 except Exception:  # pragma: no cover
@@ -61,15 +74,63 @@ def make_llm_client() -> LLMClient:
     return OpenRouterLLMClient()
 
 
+def make_reranker() -> Optional[Reranker]:
+    # Opt-in: re-ranking costs CPU per candidate, so it is only enabled when a model is configured.
+    model = os.getenv("RERANKER_MODEL")
+    if not model:
+        return None
+    if LocalCrossEncoderReranker is None:
+        raise RuntimeError("LocalCrossEncoderReranker not available; install 'sentence-transformers'.")
+    return LocalCrossEncoderReranker(model)
+
+
+def make_summary_service(vector_store: VectorStore, llm: LLMClient) -> Optional[MemberSummaryService]:
+    # Opt-in: every ingest triggers (debounced) background LLM calls for the touched periods.
+    if os.getenv("SUMMARIES_ENABLED", "").lower() not in ("1", "true", "yes"):
+        return None
+    if SqliteSummaryStore is None:
+        raise RuntimeError("SqliteSummaryStore not available.")
+    return MemberSummaryService(
+        vector_store,
+        llm,
+        SqliteSummaryStore(os.getenv("SUMMARY_DB_PATH", ".summaries.sqlite3")),
+        granularity=os.getenv("SUMMARY_PERIOD", "month"),
+        debounce_s=float(os.getenv("SUMMARY_DEBOUNCE_S", "5")),
+    )
+
+
 class DefaultRAGPipeline(RAGPipeline):
-    def __init__(self, vector_store: VectorStore, embedder: Embedder, llm: LLMClient):
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        embedder: Embedder,
+        llm: LLMClient,
+        reranker: Optional[Reranker] = None,
+        top_k: int = 5,
+        rerank_candidates: int = 50,
+        rerank_budget_s: Optional[float] = None,
+        summaries: Optional[MemberSummaryService] = None,
+        summary_snippets: int = 3,
+    ):
         self._vs = vector_store
         self._emb = embedder
         self._llm = llm
+        self._reranker = reranker
+        self._top_k = top_k
+        self._rerank_candidates = rerank_candidates
+        self._rerank_budget_s = rerank_budget_s
+        self._summaries = summaries
+        self._summary_snippets = summary_snippets
+
+    @property
+    def vector_store(self) -> VectorStore:
+        return self._vs
 
     def ingest(self, member_ref: str, items: List[FeedbackItem], time_range: Optional[Tuple[Optional[str], Optional[str]]] = None) -> None:
         # For MVP: assume member_ref is already a concrete member_id
         self._vs.upsert_member_corpus(member_id=member_ref, items=items, time_range=time_range)
+        if self._summaries is not None:
+            self._summaries.schedule(member_ref, items)
 
     def answer(
         self,
@@ -79,31 +140,88 @@ class DefaultRAGPipeline(RAGPipeline):
     ) -> QueryResponse:
         # For MVP: person_hint is the member_id. Entity resolution can be added later.
         member_id = person_hint or "unknown"
-        citations: List[FeedbackRef] = self._vs.query(member_id=member_id, text=question, time_range=time_range, k=5)
+        meta: dict = {"member_id": member_id}
+        summaries = []
+        if self._summaries is not None and is_broad_question(question, time_range):
+            # Without an explicit range, "this quarter" / "last 3 months" bound which summaries are used
+            summary_range = time_range if any(time_range or ()) else infer_time_range(question)
+            summaries = self._summaries.summaries_for(member_id, summary_range)
+        # Broad questions: compact period summaries carry the history, a few snippets give concrete examples
+        k = self._summary_snippets if summaries else self._top_k
+        citations = self._retrieve(member_id, question, time_range, k, meta)
         context = "\n".join(f"- {c.snippet}" for c in citations)
-        prompt = f"Question: {question}\nContext:\n{context}"
+        if summaries:
+            meta["periods"] = [s.period for s in summaries]
+            history = "\n".join(f"- {s.period} ({s.item_count} notes): {s.summary}" for s in summaries)
+            prompt = f"Question: {question}\nPeriod summaries:\n{history}\nContext:\n{context}"
+        else:
+            prompt = f"Question: {question}\nContext:\n{context}"
         answer = self._llm.complete(prompt)
-        return QueryResponse(answer=answer, citations=citations, meta={"member_id": member_id})
+        return QueryResponse(answer=answer, citations=citations, meta=meta)
+
+    def _retrieve(
+        self,
+        member_id: str,
+        question: str,
+        time_range: Optional[Tuple[Optional[str], Optional[str]]],
+        k: int,
+        meta: dict,
+    ) -> List[FeedbackRef]:
+        if self._reranker is None:
+            return self._vs.query(member_id=member_id, text=question, time_range=time_range, k=k)
+        # Retrieve wide, re-rank, keep only the best few so the prompt stays small
+        candidates = self._vs.query(member_id=member_id, text=question, time_range=time_range, k=self._rerank_candidates)
+        ranked = self._reranker.rerank(question, candidates, k, self._rerank_budget_s)
+        meta["rerank"] = "applied" if ranked is not None else "budget_exceeded"
+        return ranked if ranked is not None else candidates[:k]
+
+
+def _rerank_settings() -> dict:
+    budget_ms = os.getenv("RERANK_BUDGET_MS", "250")
+    return {
+        "top_k": int(os.getenv("RERANK_TOP_K", "5")),
+        "rerank_candidates": int(os.getenv("RERANK_CANDIDATES", "50")),
+        "rerank_budget_s": float(budget_ms) / 1000 if budget_ms else None,
+    }
 
 
 def make_rag_pipeline() -> RAGPipeline:
     emb = make_embedder()
-    return DefaultRAGPipeline(make_vector_store(emb), emb, make_llm_client())  # type: ignore[return-value]
+    vs = make_vector_store(emb)
+    llm_client = make_llm_client()
+    return DefaultRAGPipeline(  # type: ignore[return-value]
+        vs, emb, llm_client, make_reranker(), summaries=make_summary_service(vs, llm_client), **_rerank_settings()
+    )
 
 
 def make_rag_pipeline_with(
     llm: Optional[LLMClient] = None,
     embedder: Optional[Embedder] = None,
     vector_store: Optional[VectorStore] = None,
+    reranker: Optional[Reranker] = None,
+    summaries: Optional[MemberSummaryService] = None,
 ) -> RAGPipeline:
     emb = embedder or make_embedder()
     vs = vector_store or make_vector_store(emb)
     llm_client = llm or make_llm_client()
-    return DefaultRAGPipeline(vs, emb, llm_client)  # type: ignore[return-value]
+    rr = reranker or make_reranker()
+    sums = summaries or make_summary_service(vs, llm_client)
+    return DefaultRAGPipeline(vs, emb, llm_client, rr, summaries=sums, **_rerank_settings())  # type: ignore[return-value]
 
 # Member resolution factory (assistive; app remains the authority)
 
-def make_member_resolution_service(llm: Optional[LLMClient] = None) -> MemberResolutionService:
-    return MemberResolutionService(llm or make_llm_client())
+def make_resolution_cache() -> Optional[TTLCache]:
+    size = int(os.getenv("RESOLVE_CACHE_SIZE", "1024"))
+    if size <= 0:
+        return None
+    return TTLCache(max_size=size, ttl_s=float(os.getenv("RESOLVE_CACHE_TTL_S", "3600")))
+
+
+def make_member_resolution_service(llm: Optional[LLMClient] = None, cache: Optional[TTLCache] = None) -> MemberResolutionService:
+    return MemberResolutionService(
+        llm or make_llm_client(),
+        cache=cache or make_resolution_cache(),
+        min_cache_score=float(os.getenv("RESOLVE_CACHE_MIN_SCORE", "0.8")),
+    )
 
 
@@ -0,0 +1,42 @@
+"""
+Normalized keys for coalescing and caching.
+Two requests that differ only in whitespace/casing of free text map to the same key.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import List, Optional, Tuple
+
+from helly_ai.domain.resolution import ResolveCandidate
+
+
+def normalize_text(text: Optional[str]) -> str:
+    return " ".join((text or "").split()).casefold()
+
+
+def roster_fingerprint(candidates: Optional[List[ResolveCandidate]]) -> str:
+    """Stable hash of a candidate list, independent of candidate and email/alias order."""
+    canon = sorted(
+        (
+            c.id,
+            c.displayName,
+            sorted(e.casefold() for e in c.emails or []),
+            sorted(a.casefold() for a in c.aliases or []),
+        )
+        for c in candidates or []
+    )
+    return hashlib.sha256(json.dumps(canon, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def query_key(
+    question: str,
+    time_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
+    person_hint: Optional[str] = None,
+) -> tuple:
+    start, end = time_range or (None, None)
+    return ("query", person_hint, normalize_text(question), start, end)
+
+
+def resolve_key(text: str, candidates: Optional[List[ResolveCandidate]], context: Optional[str] = None) -> tuple:
+    return ("resolve", normalize_text(text), normalize_text(context), roster_fingerprint(candidates))
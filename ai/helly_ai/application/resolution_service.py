@@ -2,20 +2,42 @@ from __future__ import annotations
 
 from typing import List, Optional
 
+from helly_ai.application.caching import TTLCache
+from helly_ai.application.keys import resolve_key
 from helly_ai.domain.resolution import ResolveCandidate, ResolveHit, ResolveResponse
 from helly_ai.domain.protocols import LLMClient
 
 
 class MemberResolutionService:
     """
-    Stateless assistive member resolver powered by an LLM.
+    Assistive member resolver powered by an LLM.
     Does not apply permissions; candidates are supplied by the caller (/app).
+
+    Confident results are optionally cached by normalized text, context and roster fingerprint.
+    A changed roster hashes differently, so stale entries are never served and simply age out.
     """
 
-    def __init__(self, llm: LLMClient):
+    def __init__(self, llm: LLMClient, cache: Optional[TTLCache] = None, min_cache_score: float = 0.8):
         self._llm = llm
+        self._cache = cache
+        self._min_cache_score = min_cache_score
+
+    def stats(self) -> Optional[dict]:
+        return self._cache.stats() if self._cache is not None else None
 
     def resolve(self, text: str, candidates: List[ResolveCandidate], context: Optional[str] = None) -> ResolveResponse:
+        if self._cache is None:
+            return self._resolve(text, candidates, context)
+        key = resolve_key(text, candidates, context)
+        hit = self._cache.get(key)
+        if hit is not None:
+            return hit.model_copy(update={"cached": True})
+        resp = self._resolve(text, candidates, context)
+        if resp.topCandidate is not None and resp.topCandidate.score >= self._min_cache_score:
+            self._cache.set(key, resp)
+        return resp
+
+    def _resolve(self, text: str, candidates: List[ResolveCandidate], context: Optional[str] = None) -> ResolveResponse:
         # Form a compact, deterministic prompt for ranking provided candidates.
         roster = "\n".join(
             f"- id:{c.id} name:{c.displayName}"
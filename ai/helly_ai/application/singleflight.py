@@ -0,0 +1,41 @@
+"""
+Request coalescing ("single-flight") for expensive, idempotent calls.
+Concurrent callers with the same key share one in-flight computation and all
+receive its result or its exception. The computation runs in a worker thread so
+blocking work (embedding, vector search, LLM) does not stall the event loop.
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    def __init__(self) -> None:
+        self._inflight: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # Futures are bound to a loop; scope keys per loop so separate loops never share one.
+        slot = (asyncio.get_running_loop(), key)
+        self.calls += 1
+        fut = self._inflight.get(slot)
+        if fut is None:
+            fut = asyncio.ensure_future(asyncio.to_thread(fn, *args, **kwargs))
+            self._inflight[slot] = fut
+            fut.add_done_callback(lambda f: self._forget(slot, f))
+        else:
+            self.coalesced += 1
+        # Shield: a cancelled caller must not cancel the computation other callers are waiting on.
+        return await asyncio.shield(fut)
+
+    def _forget(self, slot: Tuple[asyncio.AbstractEventLoop, Hashable], fut: asyncio.Future) -> None:
+        if self._inflight.get(slot) is fut:
+            del self._inflight[slot]
+        # Mark the exception as retrieved in case every caller was cancelled before it arrived
+        if not fut.cancelled():
+            fut.exception()
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "coalesced": self.coalesced, "inflight": len(self._inflight)}
@@ -0,0 +1,220 @@
+"""
+Materialized per-member, per-period summaries.
+
+Ingest schedules a refresh of only the periods touched by the new items. A background
+worker re-summarizes those periods from the member's stored corpus; refreshes are
+debounced per member so a burst of single-item ingests costs one LLM call per period.
+Broad or long-range questions can then be answered from a few compact summaries
+instead of many raw snippets.
+"""
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from helly_ai.domain.protocols import FeedbackItem, FeedbackRef, LLMClient, VectorStore
+from helly_ai.domain.summaries import PeriodSummary, SummaryStore
+
+logger = logging.getLogger("helly_ai.summaries")
+
+_THIS = re.compile(r"\bthis (month|quarter|year)\b", re.IGNORECASE)
+_LAST = re.compile(r"\b(?:last|past) (?:(\d+|few|couple of) )?(weeks?|months?|quarters?|years?)\b", re.IGNORECASE)
+_RECENT = re.compile(r"\b(lately|recently)\b", re.IGNORECASE)
+# Anything infer_time_range understands is broad too, so the summary path sees the same phrasing
+_BROAD = re.compile(
+    r"\b(overall|in general|generally|trends?|over time|so far|history|progress(ed|ing)?|been doing)\b"
+    + "|" + "|".join(p.pattern for p in (_THIS, _LAST, _RECENT)),
+    re.IGNORECASE,
+)
+_COUNT_WORDS = {"few": 3, "couple of": 2}
+_UNIT_DAYS = {"week": 7, "month": 30, "quarter": 91, "year": 365}
+_TS_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def _parse_ts(value: Optional[str]) -> Optional[datetime]:
+    try:
+        dt = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def period_key(created_at: Optional[str], granularity: str = "month") -> Optional[str]:
+    """'2024-06' for month, '2024-W23' for ISO week; None if the timestamp cannot be parsed."""
+    dt = _parse_ts(created_at)
+    if dt is None:
+        return None
+    if granularity == "week":
+        year, week, _ = dt.isocalendar()
+        return f"{year}-W{week:02d}"
+    return f"{dt.year}-{dt.month:02d}"
+
+
+def period_bounds(period: str) -> Tuple[str, str]:
+    """[start, end) of a period key as ISO timestamps (UTC)."""
+    if "-W" in period:
+        year, week = period.split("-W")
+        start = datetime.combine(date.fromisocalendar(int(year), int(week), 1), datetime.min.time())
+        end = start + timedelta(days=7)
+    else:
+        year, month = (int(x) for x in period.split("-"))
+        start = datetime(year, month, 1)
+        end = datetime(year + month // 12, month % 12 + 1, 1)
+    return start.strftime(_TS_FORMAT), end.strftime(_TS_FORMAT)
+
+
+def infer_time_range(question: str, now: Optional[datetime] = None) -> Optional[Tuple[str, str]]:
+    """Default range from phrasing such as 'this quarter', 'last 3 months' or 'lately'; None if none is implied."""
+    now = now or datetime.now(timezone.utc)
+    start: Optional[datetime] = None
+    this = _THIS.search(question or "")
+    last = _LAST.search(question or "")
+    if this:
+        unit = this.group(1).lower()
+        month = {"month": now.month, "quarter": 3 * ((now.month - 1) // 3) + 1, "year": 1}[unit]
+        start = now.replace(month=month, day=1, hour=0, minute=0, second=0, microsecond=0)
+    elif last:
+        count = last.group(1)
+        n = int(count) if count and count.isdigit() else _COUNT_WORDS.get((count or "").lower(), 1)
+        start = now - timedelta(days=n * _UNIT_DAYS[last.group(2).lower().rstrip("s")])
+    elif _RECENT.search(question or ""):
+        start = now - timedelta(days=90)
+    if start is None:
+        return None
+    return start.strftime(_TS_FORMAT), now.strftime(_TS_FORMAT)
+
+
+def is_broad_question(
+    question: str,
+    time_range: Optional[Tuple[Optional[str], Optional[str]]] = None,
+    long_range_days: int = 45,
+) -> bool:
+    start, end = (_parse_ts(t) if t else None for t in (time_range or (None, None)))
+    if start and end and (end - start).days > long_range_days:
+        return True
+    return bool(_BROAD.search(question or ""))
+
+
+class MemberSummaryService:
+    def __init__(
+        self,
+        vector_store: VectorStore,
+        llm: LLMClient,
+        store: SummaryStore,
+        granularity: str = "month",
+        debounce_s: float = 5.0,
+        max_items: int = 200,
+        max_periods: int = 6,
+    ):
+        self._vs = vector_store
+        self._llm = llm
+        self._store = store
+        self._granularity = granularity
+        self._debounce_s = debounce_s
+        self._max_items = max_items
+        self._max_periods = max_periods
+        self._pending: Dict[str, Set[str]] = {}
+        self._due: Dict[str, float] = {}
+        self._busy = False
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+
+    def affected_periods(self, items: Iterable[FeedbackItem]) -> Set[str]:
+        return {p for p in (period_key(i.created_at, self._granularity) for i in items) if p}
+
+    def schedule(self, member_id: str, items: Iterable[FeedbackItem]) -> None:
+        """Queue a background refresh of the periods touched by items."""
+        periods = self.affected_periods(items)
+        if not periods:
+            return
+        with self._cond:
+            self._pending.setdefault(member_id, set()).update(periods)
+            self._due.setdefault(member_id, time.monotonic() + self._debounce_s)
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="member-summaries", daemon=True)
+                self._worker.start()
+            self._cond.notify_all()
+
+    def refresh(self, member_id: str, periods: Iterable[str]) -> int:
+        """Re-summarize the given periods now; returns the number of summaries written."""
+        written = 0
+        for period in sorted(set(periods)):
+            # Bounded read: only this period's items, never the member's whole corpus
+            refs = sorted(self._vs.list_items(member_id, period_bounds(period)), key=lambda r: r.created_at)
+            if not refs:
+                # Ingest only upserts, so an empty read means items predating range metadata; keep what exists
+                continue
+            self._store.upsert(
+                PeriodSummary(
+                    member_id=member_id,
+                    period=period,
+                    summary=self._summarize(period, refs[-self._max_items:]),
+                    item_count=len(refs),
+                    updated_at=datetime.now(timezone.utc).isoformat(),
+                )
+            )
+            written += 1
+        return written
+
+    def summaries_for(
+        self, member_id: str, time_range: Optional[Tuple[Optional[str], Optional[str]]] = None
+    ) -> List[PeriodSummary]:
+        """Stored summaries overlapping time_range (most recent max_periods when unbounded)."""
+        start, end = time_range or (None, None)
+        summaries = self._store.list(
+            member_id,
+            period_key(start, self._granularity) if start else None,
+            period_key(end, self._granularity) if end else None,
+        )
+        return summaries[-self._max_periods:]
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Skip the debounce and block until no refresh is pending or running."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._due = {m: 0.0 for m in self._due}
+            self._cond.notify_all()
+            while self._pending or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _summarize(self, period: str, refs: List[FeedbackRef]) -> str:
+        notes = "\n".join(f"- {r.created_at[:10]}: {r.snippet}" for r in refs)
+        prompt = (
+            f"System: Summarize a manager's feedback notes about one team member for the period {period}."
+            " Be concise (at most 5 sentences) and keep concrete strengths, concerns and changes over time.\n"
+            f"User: Notes:\n{notes}"
+        )
+        return self._llm.complete(prompt).strip()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    now = time.monotonic()
+                    ready = [m for m, due in self._due.items() if due <= now]
+                    if ready:
+                        break
+                    self._cond.wait(min(self._due.values()) - now if self._due else None)
+                batch = {m: self._pending.pop(m) for m in ready}
+                for m in ready:
+                    del self._due[m]
+                self._busy = True
+            try:
+                for member_id, periods in batch.items():
+                    try:
+                        written = self.refresh(member_id, periods)
+                        logger.info("Refreshed %d summaries for member=%s periods=%s", written, member_id, sorted(periods))
+                    except Exception:
+                        logger.exception("Summary refresh failed for member=%s", member_id)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
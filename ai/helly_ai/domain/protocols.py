@@ -1,4 +1,4 @@
-from typing import List, Protocol, Optional
+from typing import BinaryIO, List, NamedTuple, Protocol, Optional
 from pydantic import BaseModel
 
 class FeedbackItem(BaseModel):
@@ -6,6 +6,12 @@ class FeedbackItem(BaseModel):
     content: str
     created_at: str
 
+class FeedbackRow(NamedTuple):
+    """Pre-validated item from the fast wire path; attribute-compatible with FeedbackItem, without per-row model cost."""
+    id: str
+    content: str
+    created_at: str
+
 class FeedbackRef(BaseModel):
     id: str
     created_at: str
@@ -14,10 +20,19 @@ class FeedbackRef(BaseModel):
 class VectorStore(Protocol):
     def upsert_member_corpus(self, member_id: str, items: List[FeedbackItem], time_range: Optional[tuple[str, str]] = None) -> None: ...
     def query(self, member_id: str, text: str, time_range: Optional[tuple[str, str]] = None, k: int = 10) -> List[FeedbackRef]: ...
+    def list_items(self, member_id: str, time_range: Optional[tuple[str, str]] = None) -> List[FeedbackRef]: ...
+
+class SnapshotStore(Protocol):
+    def export_snapshot(self, fp: BinaryIO, compress: bool = False) -> int: ...
+    def import_snapshot(self, fp: BinaryIO) -> int: ...
 
 class Embedder(Protocol):
     def embed_texts(self, texts: List[str]) -> List[List[float]]: ...
 
+class Reranker(Protocol):
+    # Returns the best top_k candidates, or None if the latency budget ran out before scoring finished.
+    def rerank(self, question: str, candidates: List[FeedbackRef], top_k: int, budget_s: Optional[float] = None) -> Optional[List[FeedbackRef]]: ...
+
 class LLMClient(Protocol):
     def complete(self, prompt: str) -> str: ...
 
@@ -21,4 +21,5 @@ class ResolveResponse(BaseModel):
     topCandidate: Optional[ResolveHit] = None
     alternatives: List[ResolveHit] = []
     confidence: Optional[str] = None
+    cached: bool = False
 
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import List, Optional, Protocol
+from pydantic import BaseModel
+
+
+class PeriodSummary(BaseModel):
+    member_id: str
+    period: str  # "2024-06" (month) or "2024-W23" (ISO week); sorts chronologically as a string
+    summary: str
+    item_count: int
+    updated_at: str
+
+
+class SummaryStore(Protocol):
+    def upsert(self, summary: PeriodSummary) -> None: ...
+    def list(self, member_id: str, start: Optional[str] = None, end: Optional[str] = None) -> List[PeriodSummary]: ...
@@ -0,0 +1,42 @@
+"""
+Local cross-encoder re-ranking via SentenceTransformers (free to run locally).
+Scores (question, snippet) pairs jointly, which is more precise than vector similarity
+but costs CPU per candidate. Model is configurable via RERANKER_MODEL.
+"""
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import List, Optional
+
+try:
+    from sentence_transformers import CrossEncoder  # type: ignore
+except Exception:  # pragma: no cover - optional dep
+    CrossEncoder = None  # type: ignore
+
+from helly_ai.domain.protocols import Reranker, FeedbackRef
+
+
+class LocalCrossEncoderReranker(Reranker):
+    def __init__(self, model_name: str | None = None, batch_size: int = 64):
+        if CrossEncoder is None:
+            raise ImportError("sentence-transformers not installed. `pip install sentence-transformers`")
+        name = model_name or os.getenv("RERANKER_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+        self._model = CrossEncoder(name)
+        self._batch_size = batch_size
+        # Scoring runs on a dedicated worker so the caller can stop waiting when the budget is spent.
+        # An overrun keeps that worker busy; later calls queue behind it and fall back in turn.
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="reranker")
+
+    def rerank(self, question: str, candidates: List[FeedbackRef], top_k: int, budget_s: Optional[float] = None) -> Optional[List[FeedbackRef]]:
+        if not candidates:
+            return []
+        pairs = [(question, c.snippet) for c in candidates]
+        future = self._pool.submit(self._model.predict, pairs, batch_size=self._batch_size, show_progress_bar=False)
+        try:
+            scores = future.result(timeout=budget_s)
+        except FutureTimeout:
+            future.cancel()  # drops it if it never started; a running predict finishes in the background
+            return None
+        order = sorted(range(len(candidates)), key=lambda i: float(scores[i]), reverse=True)
+        return [candidates[i] for i in order[:top_k]]
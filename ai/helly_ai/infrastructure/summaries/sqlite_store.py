@@ -0,0 +1,52 @@
+"""
+Per-member period summaries persisted in a local SQLite file (stdlib, no server).
+Path is configurable via SUMMARY_DB_PATH (defaults to '.summaries.sqlite3').
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+from contextlib import closing
+from typing import List, Optional
+
+from helly_ai.domain.summaries import PeriodSummary, SummaryStore
+
+
+class SqliteSummaryStore(SummaryStore):
+    def __init__(self, path: Optional[str] = None):
+        self._path = path or os.getenv("SUMMARY_DB_PATH", ".summaries.sqlite3")
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS member_summaries ("
+                " member_id TEXT NOT NULL, period TEXT NOT NULL, summary TEXT NOT NULL,"
+                " item_count INTEGER NOT NULL, updated_at TEXT NOT NULL,"
+                " PRIMARY KEY (member_id, period))"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # Short-lived connections: the store is used from request and background threads
+        return sqlite3.connect(self._path, timeout=10)
+
+    def upsert(self, summary: PeriodSummary) -> None:
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO member_summaries (member_id, period, summary, item_count, updated_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (summary.member_id, summary.period, summary.summary, summary.item_count, summary.updated_at),
+            )
+
+    def list(self, member_id: str, start: Optional[str] = None, end: Optional[str] = None) -> List[PeriodSummary]:
+        sql = "SELECT member_id, period, summary, item_count, updated_at FROM member_summaries WHERE member_id = ?"
+        params: list = [member_id]
+        if start:
+            sql += " AND period >= ?"
+            params.append(start)
+        if end:
+            sql += " AND period <= ?"
+            params.append(end)
+        with closing(self._connect()) as conn:
+            rows = conn.execute(sql + " ORDER BY period", params).fetchall()
+        return [
+            PeriodSummary(member_id=r[0], period=r[1], summary=r[2], item_count=r[3], updated_at=r[4])
+            for r in rows
+        ]
@@ -6,7 +6,11 @@ Embeddings are supplied explicitly via an Embedder to keep concerns separate.
 from __future__ import annotations
 
 import os
-from typing import List, Optional
+import threading
+from datetime import datetime, timezone
+from typing import BinaryIO, Iterator, List, Optional
+
+import numpy as np
 
 try:
     import chromadb  # type: ignore
@@ -14,6 +18,27 @@ except Exception:  # pragma: no cover
     chromadb = None  # type: ignore
 
 from helly_ai.domain.protocols import VectorStore, FeedbackItem, FeedbackRef, Embedder
+from helly_ai.infrastructure.vectorstores.snapshot import SnapshotRecord, read_snapshot, write_snapshot
+
+_COLLECTION_PREFIX = "member_"
+_SNAPSHOT_PAGE = 5000
+
+
+def _epoch(created_at: Optional[str]) -> Optional[float]:
+    try:
+        dt = datetime.fromisoformat(str(created_at).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+
+
+def _item_meta(created_at: Optional[str]) -> dict:
+    # created_ts mirrors created_at as a number so range reads can use Chroma's `where` ($gte/$lt are numeric only)
+    meta = {"created_at": created_at}
+    ts = _epoch(created_at)
+    if ts is not None:
+        meta["created_ts"] = ts
+    return meta
 
 
 class ChromaVectorStore(VectorStore):
@@ -23,16 +48,18 @@ class ChromaVectorStore(VectorStore):
         self._embedder = embedder
         self._persist_dir = persist_dir or os.getenv("CHROMA_PERSIST_DIR", ".chroma")
         self._client = chromadb.PersistentClient(path=self._persist_dir)
+        self._ts_ready: set[str] = set()
+        self._ts_lock = threading.Lock()
 
     def _collection(self, member_id: str):
-        name = f"member_{member_id}"
+        name = f"{_COLLECTION_PREFIX}{member_id}"
         return self._client.get_or_create_collection(name)
 
     def upsert_member_corpus(self, member_id: str, items: List[FeedbackItem], time_range: Optional[tuple[str, str]] = None) -> None:
         col = self._collection(member_id)
         ids = [i.id for i in items]
         docs = [i.content for i in items]
-        metas = [{"created_at": i.created_at} for i in items]
+        metas = [_item_meta(i.created_at) for i in items]
         embeddings = self._embedder.embed_texts(docs)
         col.upsert(ids=ids, documents=docs, metadatas=metas, embeddings=embeddings)
 
@@ -50,3 +77,108 @@ class ChromaVectorStore(VectorStore):
             results.append(FeedbackRef(id=str(i), created_at=str(created_at or ""), snippet=str(doc)))
         return results
 
+
+    def list_items(self, member_id: str, time_range: Optional[tuple[str, str]] = None) -> List[FeedbackRef]:
+        """
+        Stored items for a member (no ranking), optionally limited to created_at in [start, end).
+        Range reads filter on created_ts; the first one per collection backfills it on older items.
+        """
+        col = self._collection(member_id)
+        where = None
+        if time_range:
+            self._ensure_created_ts(col)
+            conds = []
+            start, end = _epoch(time_range[0]) if time_range[0] else None, _epoch(time_range[1]) if time_range[1] else None
+            if start is not None:
+                conds.append({"created_ts": {"$gte": start}})
+            if end is not None:
+                conds.append({"created_ts": {"$lt": end}})
+            where = conds[0] if len(conds) == 1 else ({"$and": conds} if conds else None)
+        res = col.get(where=where, include=["documents", "metadatas"])
+        results: List[FeedbackRef] = []
+        for i, doc, meta in zip(res.get("ids") or [], res.get("documents") or [], res.get("metadatas") or []):
+            created_at = meta.get("created_at") if isinstance(meta, dict) else None
+            results.append(FeedbackRef(id=str(i), created_at=str(created_at or ""), snippet=str(doc)))
+        return results
+
+    def _ensure_created_ts(self, col) -> None:
+        """Add created_ts to items written before it existed, once per collection and process."""
+        with self._ts_lock:
+            if col.name in self._ts_ready:
+                return
+            offset = 0
+            while True:
+                page = col.get(include=["metadatas"], limit=_SNAPSHOT_PAGE, offset=offset)
+                ids = page.get("ids") or []
+                if not ids:
+                    break
+                missing = [
+                    (i, _item_meta(m.get("created_at")) | m)
+                    for i, m in zip(ids, page.get("metadatas") or [])
+                    if isinstance(m, dict) and "created_ts" not in m and _epoch(m.get("created_at")) is not None
+                ]
+                if missing:
+                    col.update(ids=[i for i, _ in missing], metadatas=[m for _, m in missing])
+                offset += len(ids)
+            self._ts_ready.add(col.name)
+
+    # ----- Snapshots -----
+
+    def _member_ids(self) -> List[str]:
+        # list_collections returns names on some chromadb versions and Collection objects on others
+        names = [c if isinstance(c, str) else c.name for c in self._client.list_collections()]
+        return sorted(n[len(_COLLECTION_PREFIX):] for n in names if n.startswith(_COLLECTION_PREFIX))
+
+    def _snapshot_records(self) -> Iterator[SnapshotRecord]:
+        for member_id in self._member_ids():
+            col = self._collection(member_id)
+            offset = 0
+            while True:
+                page = col.get(include=["documents", "metadatas", "embeddings"], limit=_SNAPSHOT_PAGE, offset=offset)
+                ids = page.get("ids") or []
+                if not ids:
+                    break
+                embeddings = page.get("embeddings")
+                yield SnapshotRecord(
+                    member_id=member_id,
+                    ids=list(ids),
+                    documents=list(page.get("documents") or []),
+                    metadatas=list(page.get("metadatas") or []),
+                    embeddings=np.asarray(embeddings if embeddings is not None else [], dtype=np.float32),
+                )
+                offset += len(ids)
+
+    def export_snapshot(self, fp: BinaryIO, compress: bool = False) -> int:
+        """Write every member's ids, documents, metadata and embeddings to fp; returns the item count."""
+        return write_snapshot(fp, self._snapshot_records(), compress=compress)
+
+    def import_snapshot(self, fp: BinaryIO) -> int:
+        """
+        Bulk-load a snapshot with its stored embeddings (the embedder is not called); returns the item count.
+        fp must be seekable: the whole stream is decoded once before the first upsert, so a corrupt or
+        truncated snapshot raises ValueError without writing anything. A Chroma failure during the write
+        pass can still leave a partial import; re-importing the same snapshot is an idempotent upsert.
+        """
+        start = fp.tell()
+        for _ in read_snapshot(fp):
+            pass
+        fp.seek(start)
+        total = 0
+        for rec in read_snapshot(fp):
+            if not rec.ids:
+                continue
+            col = self._collection(rec.member_id)
+            metadatas = [
+                _item_meta(m.get("created_at")) | m if isinstance(m, dict) and "created_ts" not in m else m
+                for m in rec.metadatas
+            ]
+            for start in range(0, len(rec.ids), _SNAPSHOT_PAGE):
+                end = start + _SNAPSHOT_PAGE
+                col.upsert(
+                    ids=rec.ids[start:end],
+                    documents=rec.documents[start:end],
+                    metadatas=metadatas[start:end],
+                    embeddings=rec.embeddings[start:end],
+                )
+            total += len(rec.ids)
+        return total
@@ -0,0 +1,120 @@
+"""
+Versioned binary snapshot format for vector index contents.
+
+Layout (little-endian):
+  header: magic b"HLYSNAP\\0" | u16 version | u8 compression (0 = none, 1 = gzip)
+  body (gzip stream when compressed), a sequence of records:
+    u8 tag=1 | u32 meta_len | meta JSON {member_id, count, dim, ids, documents, metadatas}
+             | float32[count * dim] embeddings, row-major, one contiguous block
+  u8 tag=0 end marker
+
+Large collections are split across several records for the same member so that
+neither export nor import needs to hold a whole collection in memory.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+MAGIC = b"HLYSNAP\0"
+VERSION = 1
+_HEADER = struct.Struct("<8sHB")
+_RECORD = struct.Struct("<BI")
+_TAG_END = 0
+_TAG_RECORD = 1
+
+
+@dataclass
+class SnapshotRecord:
+    member_id: str
+    ids: List[str]
+    documents: List[str]
+    metadatas: List[Optional[dict]]
+    embeddings: np.ndarray  # float32, shape (count, dim)
+
+
+def write_snapshot(fp: BinaryIO, records: Iterable[SnapshotRecord], compress: bool = False) -> int:
+    """Write records to fp; returns the number of items written."""
+    fp.write(_HEADER.pack(MAGIC, VERSION, 1 if compress else 0))
+    out: BinaryIO = gzip.GzipFile(fileobj=fp, mode="wb", compresslevel=6) if compress else fp  # type: ignore[assignment]
+    total = 0
+    try:
+        for rec in records:
+            emb = np.ascontiguousarray(rec.embeddings, dtype="<f4")
+            count = len(rec.ids)
+            dim = int(emb.shape[1]) if emb.ndim == 2 and count else 0
+            meta = json.dumps(
+                {
+                    "member_id": rec.member_id,
+                    "count": count,
+                    "dim": dim,
+                    "ids": rec.ids,
+                    "documents": rec.documents,
+                    "metadatas": rec.metadatas,
+                },
+                separators=(",", ":"),
+            ).encode("utf-8")
+            out.write(_RECORD.pack(_TAG_RECORD, len(meta)))
+            out.write(meta)
+            out.write(emb.tobytes())
+            total += count
+        out.write(bytes([_TAG_END]))
+    finally:
+        if compress:
+            out.close()  # flushes the gzip trailer; leaves fp open
+    return total
+
+
+def _read_exact(fp: BinaryIO, n: int) -> bytes:
+    buf = fp.read(n)
+    if len(buf) != n:
+        raise ValueError("Truncated snapshot")
+    return buf
+
+
+def read_snapshot(fp: BinaryIO) -> Iterator[SnapshotRecord]:
+    """Yield records from fp. Any malformed, truncated or mis-compressed input raises ValueError."""
+    try:
+        yield from _read_records(fp)
+    except ValueError:
+        raise
+    except (EOFError, OSError, KeyError, TypeError, struct.error, zlib.error) as e:
+        # e.g. truncated gzip (EOFError), non-gzip body (BadGzipFile), missing meta keys
+        raise ValueError(f"Corrupt snapshot: {e!r}") from e
+
+
+def _read_records(fp: BinaryIO) -> Iterator[SnapshotRecord]:
+    magic, version, compression = _HEADER.unpack(_read_exact(fp, _HEADER.size))
+    if magic != MAGIC:
+        raise ValueError("Not a Helly vector snapshot")
+    if version != VERSION:
+        raise ValueError(f"Unsupported snapshot version {version} (expected {VERSION})")
+    body: BinaryIO = gzip.GzipFile(fileobj=fp, mode="rb") if compression == 1 else fp  # type: ignore[assignment]
+    while True:
+        tag = _read_exact(body, 1)[0]
+        if tag == _TAG_END:
+            # Read to EOF so gzip verifies its CRC/length trailer (a cut-off trailer raises EOFError)
+            if body.read(1):
+                raise ValueError("Corrupt snapshot: data after end marker")
+            return
+        if tag != _TAG_RECORD:
+            raise ValueError(f"Corrupt snapshot: unknown record tag {tag}")
+        (meta_len,) = struct.unpack("<I", _read_exact(body, 4))
+        meta = json.loads(_read_exact(body, meta_len))
+        count, dim = meta["count"], meta["dim"]
+        if not (len(meta["ids"]) == len(meta["documents"]) == len(meta["metadatas"]) == count):
+            raise ValueError("Corrupt snapshot: record field lengths do not match its count")
+        emb = np.frombuffer(_read_exact(body, count * dim * 4), dtype="<f4").reshape(count, dim)
+        yield SnapshotRecord(
+            member_id=meta["member_id"],
+            ids=meta["ids"],
+            documents=meta["documents"],
+            metadatas=meta["metadatas"],
+            embeddings=emb,
+        )
@@ -28,10 +28,21 @@ def load_dotenv_if_present():
 load_dotenv_if_present()
 
 from helly_ai.api.routers import router  # noqa: E402 (import after env load)
+from helly_ai.api.profiling import ProfileStore, ProfilingMiddleware  # noqa: E402
 
 app = FastAPI(title="Helly AI", version="0.1.0")
 app.include_router(router)
 
+# Opt-in request profiling; when disabled the middleware is not installed at all
+if os.getenv("PROFILE_ENABLED", "").lower() in ("1", "true", "yes"):
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=ProfileStore(os.getenv("PROFILE_DIR", ".profiles"), keep=int(os.getenv("PROFILE_KEEP", "50"))),
+        sample_rate=float(os.getenv("PROFILE_SAMPLE_RATE", "0")),
+        interval_s=float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000,
+    )
+    logger.info("Request profiling enabled (dir=%s)", os.getenv("PROFILE_DIR", ".profiles"))
+
 
 @app.on_event("startup")
 async def on_startup():
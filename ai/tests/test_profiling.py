@@ -0,0 +1,79 @@
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from helly_ai.api.profiling import ProfileStore, ProfilingMiddleware, traced
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _busy_work(seconds: float) -> int:
+    end, n = time.perf_counter() + seconds, 0
+    while time.perf_counter() < end:
+        n += 1
+    return n
+
+
+def _background_work(stop: threading.Event) -> None:
+    while not stop.is_set():
+        _busy_work(0.01)
+
+
+def _client(store: ProfileStore, sample_rate: float = 0.0) -> TestClient:
+    app = FastAPI()
+
+    @app.post("/v1/query")
+    async def query():
+        return {"n": await asyncio.to_thread(traced(_busy_work), 0.1)}
+
+    app.add_middleware(ProfilingMiddleware, store=store, sample_rate=sample_rate, interval_s=0.002, focus_dir=TESTS_DIR)
+    return TestClient(app)
+
+
+def test_debug_header_writes_folded_profile(tmp_path: Path):
+    store = ProfileStore(str(tmp_path))
+    resp = _client(store).post("/v1/query", headers={"X-Helly-Profile": "1"})
+    name = resp.headers["x-helly-profile-id"]
+    assert [p["name"] for p in store.list()] == [name]
+    lines = store.read(name).splitlines()
+    assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any("_busy_work" in line for line in lines)
+
+
+def test_other_threads_in_app_code_are_not_sampled(tmp_path: Path):
+    store = ProfileStore(str(tmp_path))
+    stop = threading.Event()
+    background = threading.Thread(target=_background_work, args=(stop,), daemon=True)
+    background.start()
+    try:
+        resp = _client(store).post("/v1/query", headers={"X-Helly-Profile": "1"})
+    finally:
+        stop.set()
+        background.join()
+    profile = store.read(resp.headers["x-helly-profile-id"])
+    assert "_busy_work" in profile
+    assert "_background_work" not in profile
+
+
+def test_unsampled_requests_are_not_profiled(tmp_path: Path):
+    store = ProfileStore(str(tmp_path))
+    resp = _client(store, sample_rate=0.0).post("/v1/query")
+    assert "x-helly-profile-id" not in resp.headers
+    assert store.list() == []
+
+
+def test_store_keeps_newest_and_rejects_path_traversal(tmp_path: Path):
+    from collections import Counter
+
+    store = ProfileStore(str(tmp_path / "profiles"), keep=2)
+    for i in range(3):
+        store.save(f"p{i}.folded", Counter({"a;b": i + 1}))
+        os.utime(tmp_path / "profiles" / f"p{i}.folded", (i, i))
+    assert [p["name"] for p in store.list()] == ["p2.folded", "p1.folded"]
+    assert store.read("p2.folded") == "a;b 3\n"
+    assert store.read("../profiles/p2.folded") is None
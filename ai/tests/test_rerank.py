@@ -0,0 +1,103 @@
+import time
+from typing import List, Optional
+
+from helly_ai.application.container import DefaultRAGPipeline
+from helly_ai.domain.protocols import FeedbackRef
+from helly_ai.infrastructure.rerankers import cross_encoder
+
+
+class FakeVectorStore:
+    def __init__(self, refs: List[FeedbackRef]) -> None:
+        self.refs = refs
+        self.last_k: Optional[int] = None
+
+    def upsert_member_corpus(self, member_id, items, time_range=None) -> None:
+        pass
+
+    def query(self, member_id, text, time_range=None, k=10) -> List[FeedbackRef]:
+        self.last_k = k
+        return self.refs[:k]
+
+
+class FakeLLM:
+    def __init__(self) -> None:
+        self.last_prompt: Optional[str] = None
+
+    def complete(self, prompt: str) -> str:
+        self.last_prompt = prompt
+        return "ok"
+
+
+class ReverseReranker:
+    def __init__(self, over_budget: bool = False) -> None:
+        self.over_budget = over_budget
+
+    def rerank(self, question, candidates, top_k, budget_s=None):
+        if self.over_budget:
+            return None
+        return list(reversed(candidates))[:top_k]
+
+
+def _refs(n: int) -> List[FeedbackRef]:
+    return [FeedbackRef(id=f"r{i}", created_at="2024-01-01T00:00:00Z", snippet=f"snippet {i}") for i in range(n)]
+
+
+def test_reranker_retrieves_wide_and_keeps_best_few():
+    vs, llm = FakeVectorStore(_refs(50)), FakeLLM()
+    pipeline = DefaultRAGPipeline(vs, None, llm, reranker=ReverseReranker(), top_k=3, rerank_candidates=50)
+    resp = pipeline.answer(question="q", person_hint="max")
+    assert vs.last_k == 50
+    assert [c.id for c in resp.citations] == ["r49", "r48", "r47"]
+    assert resp.meta["rerank"] == "applied"
+    assert "snippet 0" not in llm.last_prompt
+
+
+def test_reranker_budget_exceeded_falls_back_to_vector_order():
+    vs = FakeVectorStore(_refs(50))
+    pipeline = DefaultRAGPipeline(vs, None, FakeLLM(), reranker=ReverseReranker(over_budget=True), top_k=3)
+    resp = pipeline.answer(question="q", person_hint="max")
+    assert [c.id for c in resp.citations] == ["r0", "r1", "r2"]
+    assert resp.meta["rerank"] == "budget_exceeded"
+
+
+def test_no_reranker_uses_top_k_directly():
+    vs = FakeVectorStore(_refs(50))
+    resp = DefaultRAGPipeline(vs, None, FakeLLM()).answer(question="q", person_hint="max")
+    assert vs.last_k == 5
+    assert len(resp.citations) == 5
+
+
+class SlowCrossEncoder:
+    """Stands in for sentence_transformers.CrossEncoder: scores by snippet number after a delay."""
+    delay_s = 0.0
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def predict(self, pairs, batch_size=32, show_progress_bar=False):
+        time.sleep(self.delay_s)
+        return [float(snippet.split()[-1]) for _, snippet in pairs]
+
+
+def _cross_encoder_reranker(monkeypatch, delay_s: float):
+    monkeypatch.setattr(cross_encoder, "CrossEncoder", type("Slow", (SlowCrossEncoder,), {"delay_s": delay_s}))
+    return cross_encoder.LocalCrossEncoderReranker("fake-model")
+
+
+def test_cross_encoder_orders_by_score_within_budget(monkeypatch):
+    reranker = _cross_encoder_reranker(monkeypatch, delay_s=0.0)
+    ranked = reranker.rerank("q", _refs(50), top_k=3, budget_s=1.0)
+    assert [c.id for c in ranked] == ["r49", "r48", "r47"]
+
+
+def test_cross_encoder_budget_bounds_wall_time(monkeypatch):
+    reranker = _cross_encoder_reranker(monkeypatch, delay_s=1.0)
+    start = time.perf_counter()
+    assert reranker.rerank("q", _refs(50), top_k=3, budget_s=0.05) is None
+    assert time.perf_counter() - start < 0.5
+
+    resp = DefaultRAGPipeline(FakeVectorStore(_refs(50)), None, FakeLLM(), reranker=reranker, top_k=3, rerank_budget_s=0.05).answer(
+        question="q", person_hint="max"
+    )
+    assert resp.meta["rerank"] == "budget_exceeded"
+    assert [c.id for c in resp.citations] == ["r0", "r1", "r2"]
@@ -0,0 +1,61 @@
+import json
+
+from helly_ai.application.caching import TTLCache
+from helly_ai.application.resolution_service import MemberResolutionService
+from helly_ai.domain.resolution import ResolveCandidate
+
+
+class CountingLLM:
+    def __init__(self, score: float) -> None:
+        self.calls = 0
+        self.score = score
+
+    def complete(self, prompt: str) -> str:
+        self.calls += 1
+        return json.dumps({"topCandidate": {"id": "max-1", "score": self.score}, "alternatives": [], "confidence": "high"})
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+ROSTER = [ResolveCandidate(id="max-1", displayName="Max"), ResolveCandidate(id="lisa-2", displayName="Lisa")]
+
+
+def test_repeated_phrasing_is_served_from_cache():
+    llm = CountingLLM(score=0.95)
+    svc = MemberResolutionService(llm, cache=TTLCache(max_size=10, ttl_s=60))
+    first = svc.resolve("1:1 with Max", ROSTER)
+    second = svc.resolve("  1:1 with max ", list(reversed(ROSTER)))
+    assert llm.calls == 1
+    assert (first.cached, second.cached) == (False, True)
+    assert second.topCandidate.id == "max-1"
+
+
+def test_roster_change_and_low_confidence_bypass_cache():
+    llm = CountingLLM(score=0.95)
+    svc = MemberResolutionService(llm, cache=TTLCache(max_size=10, ttl_s=60))
+    svc.resolve("1:1 with Max", ROSTER)
+    svc.resolve("1:1 with Max", ROSTER + [ResolveCandidate(id="max-3", displayName="Max B")])
+    assert llm.calls == 2
+
+    llm.score = 0.4
+    svc.resolve("sync with Lisa", ROSTER)
+    svc.resolve("sync with Lisa", ROSTER)
+    assert llm.calls == 4
+
+
+def test_ttl_cache_expiry_and_size_bound():
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, ttl_s=10, clock=clock)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)  # evicts least recently used "b"
+    assert cache.get("b") is None and cache.get("a") == 1
+    clock.now = 11
+    assert cache.get("a") is None and cache.get("c") is None
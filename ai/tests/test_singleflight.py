@@ -0,0 +1,63 @@
+import asyncio
+import threading
+
+import pytest
+
+from helly_ai.application.keys import query_key, resolve_key
+from helly_ai.application.singleflight import SingleFlight
+from helly_ai.domain.resolution import ResolveCandidate
+
+
+def test_concurrent_identical_calls_share_one_computation():
+    flight = SingleFlight()
+    calls = []
+    release = threading.Event()
+
+    def slow(x):
+        calls.append(x)
+        release.wait(5)
+        return {"answer": x}
+
+    async def run():
+        tasks = [asyncio.create_task(flight.do("k", slow, 1)) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        return await asyncio.gather(*tasks)
+
+    results = asyncio.run(run())
+    assert calls == [1]
+    assert all(r is results[0] for r in results)
+    assert flight.stats() == {"calls": 5, "coalesced": 4, "inflight": 0}
+
+
+def test_errors_propagate_and_cancelled_waiter_does_not_cancel_others():
+    flight = SingleFlight()
+    release = threading.Event()
+
+    def boom():
+        release.wait(5)
+        raise ValueError("llm down")
+
+    async def run():
+        first = asyncio.create_task(flight.do("k", boom))
+        second = asyncio.create_task(flight.do("k", boom))
+        await asyncio.sleep(0.05)
+        first.cancel()
+        release.set()
+        with pytest.raises(ValueError, match="llm down"):
+            await second
+        with pytest.raises(asyncio.CancelledError):
+            await first
+
+    asyncio.run(run())
+    assert flight.stats()["inflight"] == 0
+
+
+def test_keys_normalize_text_and_roster_order():
+    assert query_key("What about  Max?", ("a", None), "m1") == query_key(" what about max? ", ("a", None), "m1")
+    assert query_key("q", None, "m1") != query_key("q", None, "m2")
+    a = ResolveCandidate(id="1", displayName="Max", aliases=["M", "Maxi"])
+    b = ResolveCandidate(id="2", displayName="Lisa")
+    flipped = ResolveCandidate(id="1", displayName="Max", aliases=["Maxi", "M"])
+    assert resolve_key("1:1 with Max", [a, b]) == resolve_key("1:1 with  max", [b, flipped])
+    assert resolve_key("1:1 with Max", [a, b]) != resolve_key("1:1 with Max", [a])
@@ -0,0 +1,96 @@
+import io
+from pathlib import Path
+from typing import List
+
+import numpy as np
+import pytest
+
+from helly_ai.domain.protocols import FeedbackItem
+from helly_ai.infrastructure.vectorstores.chroma_store import ChromaVectorStore
+from helly_ai.infrastructure.vectorstores.snapshot import SnapshotRecord, read_snapshot, write_snapshot
+
+
+class HashEmbedder:
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        return [[float(len(t)), float(sum(map(ord, t)) % 97), 1.0] for t in texts]
+
+
+class NoEmbedder:
+    def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        raise AssertionError("import must not call the embedder")
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_snapshot_format_roundtrip(compress: bool):
+    rec = SnapshotRecord(
+        member_id="max",
+        ids=["a", "b"],
+        documents=["Max did great", "Max was late"],
+        metadatas=[{"created_at": "2024-01-01T00:00:00Z"}, None],
+        embeddings=np.arange(6, dtype=np.float32).reshape(2, 3),
+    )
+    buf = io.BytesIO()
+    assert write_snapshot(buf, [rec], compress=compress) == 2
+    buf.seek(0)
+    (out,) = list(read_snapshot(buf))
+    assert (out.member_id, out.ids, out.documents, out.metadatas) == ("max", rec.ids, rec.documents, rec.metadatas)
+    np.testing.assert_array_equal(out.embeddings, rec.embeddings)
+
+
+def _snapshot_bytes(compress: bool) -> bytes:
+    recs = [
+        SnapshotRecord(member_id=f"m{i}", ids=[f"{i}"], documents=["doc"], metadatas=[None], embeddings=np.ones((1, 3), dtype=np.float32))
+        for i in range(3)
+    ]
+    buf = io.BytesIO()
+    write_snapshot(buf, recs, compress=compress)
+    return buf.getvalue()
+
+
+def test_snapshot_rejects_unknown_data():
+    with pytest.raises(ValueError):
+        list(read_snapshot(io.BytesIO(b"not a snapshot at all")))
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_truncated_snapshot_raises_value_error(compress: bool):
+    data = _snapshot_bytes(compress)
+    for cut in (len(data) - 1, len(data) // 2, 12):
+        with pytest.raises(ValueError):
+            list(read_snapshot(io.BytesIO(data[:cut])))
+
+
+def test_compressed_flag_with_plain_body_raises_value_error():
+    plain = _snapshot_bytes(compress=False)
+    flagged = plain[:10] + bytes([1]) + plain[11:]  # header says gzip, body is not
+    with pytest.raises(ValueError):
+        list(read_snapshot(io.BytesIO(flagged)))
+
+
+def test_truncated_import_writes_nothing(tmp_path: Path):
+    store = ChromaVectorStore(embedder=NoEmbedder(), persist_dir=str(tmp_path / "dst"))
+    data = _snapshot_bytes(compress=True)
+    with pytest.raises(ValueError):
+        store.import_snapshot(io.BytesIO(data[: len(data) - 8]))
+    assert store._member_ids() == []
+
+
+def test_chroma_export_import_without_embedder(tmp_path: Path):
+    src = ChromaVectorStore(embedder=HashEmbedder(), persist_dir=str(tmp_path / "src"))
+    src.upsert_member_corpus("max-123", [
+        FeedbackItem(id="m1", content="Max improved the API performance.", created_at="2024-06-01T10:00:00Z"),
+        FeedbackItem(id="m2", content="Max struggled with communication.", created_at="2024-07-20T09:30:00Z"),
+    ])
+    src.upsert_member_corpus("lisa-456", [
+        FeedbackItem(id="l1", content="Lisa organized an offsite.", created_at="2024-06-15T12:00:00Z"),
+    ])
+    buf = io.BytesIO()
+    assert src.export_snapshot(buf, compress=True) == 3
+    buf.seek(0)
+
+    dst = ChromaVectorStore(embedder=NoEmbedder(), persist_dir=str(tmp_path / "dst"))
+    assert dst.import_snapshot(buf) == 3
+    got = dst._collection("max-123").get(ids=["m1"], include=["documents", "metadatas", "embeddings"])
+    assert got["documents"] == ["Max improved the API performance."]
+    assert got["metadatas"][0]["created_at"] == "2024-06-01T10:00:00Z"
+    np.testing.assert_allclose(got["embeddings"][0], HashEmbedder().embed_texts(["Max improved the API performance."])[0])
@@ -0,0 +1,156 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+from helly_ai.application.container import DefaultRAGPipeline
+from helly_ai.application.summary_service import (
+    MemberSummaryService,
+    infer_time_range,
+    is_broad_question,
+    period_bounds,
+    period_key,
+)
+from helly_ai.domain.protocols import FeedbackItem, FeedbackRef
+from helly_ai.infrastructure.summaries.sqlite_store import SqliteSummaryStore
+
+
+class InMemoryVectorStore:
+    def __init__(self) -> None:
+        self.items: Dict[str, Dict[str, FeedbackItem]] = {}
+        self.list_calls: List[tuple] = []
+
+    def upsert_member_corpus(self, member_id, items, time_range=None) -> None:
+        self.items.setdefault(member_id, {}).update({i.id: i for i in items})
+
+    def query(self, member_id, text, time_range=None, k=10) -> List[FeedbackRef]:
+        return self.list_items(member_id)[:k]
+
+    def list_items(self, member_id, time_range=None) -> List[FeedbackRef]:
+        self.list_calls.append((member_id, time_range))
+        start, end = time_range or (None, None)
+        return [
+            FeedbackRef(id=i.id, created_at=i.created_at, snippet=i.content)
+            for i in self.items.get(member_id, {}).values()
+            if (start is None or i.created_at >= start) and (end is None or i.created_at < end)
+        ]
+
+
+class RecordingLLM:
+    def __init__(self) -> None:
+        self.prompts: List[str] = []
+
+    def complete(self, prompt: str) -> str:
+        self.prompts.append(prompt)
+        return f"summary #{len(self.prompts)}"
+
+
+def _item(i: str, created_at: str) -> FeedbackItem:
+    return FeedbackItem(id=i, content=f"note {i}", created_at=created_at)
+
+
+def test_ingest_refreshes_only_affected_periods(tmp_path: Path):
+    vs, llm = InMemoryVectorStore(), RecordingLLM()
+    store = SqliteSummaryStore(str(tmp_path / "summaries.sqlite3"))
+    summaries = MemberSummaryService(vs, llm, store, debounce_s=60)
+    pipeline = DefaultRAGPipeline(vs, None, llm, summaries=summaries)
+
+    pipeline.ingest("lisa", [_item("1", "2024-05-03T10:00:00Z"), _item("2", "2024-06-10T10:00:00Z")])
+    pipeline.ingest("lisa", [_item("3", "2024-06-20T10:00:00Z")])  # debounced into the same refresh
+    assert summaries.wait_idle(timeout=5)
+    assert len(llm.prompts) == 2
+    assert [(s.period, s.item_count) for s in store.list("lisa")] == [("2024-05", 1), ("2024-06", 2)]
+
+    vs.list_calls.clear()
+    pipeline.ingest("lisa", [_item("4", "2024-06-25T10:00:00Z")])
+    assert summaries.wait_idle(timeout=5)
+    assert len(llm.prompts) == 3
+    assert "2024-06" in llm.prompts[-1] and "note 1" not in llm.prompts[-1]
+    assert vs.list_calls == [("lisa", ("2024-06-01T00:00:00Z", "2024-07-01T00:00:00Z"))]
+
+
+def test_broad_question_uses_period_summaries(tmp_path: Path):
+    vs, llm = InMemoryVectorStore(), RecordingLLM()
+    summaries = MemberSummaryService(vs, llm, SqliteSummaryStore(str(tmp_path / "s.sqlite3")), debounce_s=0)
+    pipeline = DefaultRAGPipeline(vs, None, llm, summaries=summaries, summary_snippets=1)
+    pipeline.ingest("lisa", [_item(str(i), f"2024-0{m}-15T10:00:00Z") for i, m in enumerate([4, 5, 6])])
+    assert summaries.wait_idle(timeout=5)
+
+    resp = pipeline.answer("How has Lisa been doing overall?", person_hint="lisa")
+    assert resp.meta["periods"] == ["2024-04", "2024-05", "2024-06"]
+    assert "Period summaries:" in llm.prompts[-1]
+    assert len(resp.citations) == 1
+
+    pipeline.answer("What did Lisa say about the offsite?", person_hint="lisa")
+    assert "Period summaries:" not in llm.prompts[-1]
+
+
+def test_last_n_months_question_uses_summaries_in_that_range(tmp_path: Path):
+    vs, llm = InMemoryVectorStore(), RecordingLLM()
+    summaries = MemberSummaryService(vs, llm, SqliteSummaryStore(str(tmp_path / "s.sqlite3")), debounce_s=0)
+    pipeline = DefaultRAGPipeline(vs, None, llm, summaries=summaries, summary_snippets=1)
+    now = datetime.now(timezone.utc)
+    dates = [now - timedelta(days=d) for d in (300, 40, 2)]
+    pipeline.ingest("max", [_item(str(i), d.strftime("%Y-%m-%dT%H:%M:%SZ")) for i, d in enumerate(dates)])
+    assert summaries.wait_idle(timeout=5)
+
+    resp = pipeline.answer("How did Max do over the last 3 months?", person_hint="max")
+    assert "Period summaries:" in llm.prompts[-1]
+    assert resp.meta["periods"] == sorted({period_key(d.isoformat()) for d in dates[1:]})
+
+
+def test_question_phrasing_implies_summary_range():
+    now = datetime(2024, 8, 20, 12, 0, tzinfo=timezone.utc)
+    assert infer_time_range("How has Lisa been doing this quarter?", now) == ("2024-07-01T00:00:00Z", "2024-08-20T12:00:00Z")
+    assert infer_time_range("Max over the last 3 months", now)[0] == "2024-05-22T12:00:00Z"
+    assert infer_time_range("How has Max been doing overall?", now) is None
+    assert infer_time_range("past couple of months", now)[0] == "2024-06-21T12:00:00Z"
+    for question in ("over the last 3 months?", "last month", "this month", "last 6 weeks", "past couple of months"):
+        assert is_broad_question(question)
+
+
+def test_period_helpers():
+    assert period_bounds("2024-12") == ("2024-12-01T00:00:00Z", "2025-01-01T00:00:00Z")
+    assert period_bounds("2024-W22") == ("2024-05-27T00:00:00Z", "2024-06-03T00:00:00Z")
+    assert period_key("2024-06-01T10:00:00Z") == "2024-06"
+    assert period_key("2024-06-01T10:00:00Z", "week") == "2024-W22"
+    assert period_key("not a date") is None
+    assert is_broad_question("anything", ("2024-01-01", "2024-06-30T00:00:00Z"))
+    assert not is_broad_question("What happened in the demo?", ("2024-06-01", "2024-06-07"))
+
+
+def test_chroma_list_items_reads_only_the_requested_range(tmp_path: Path):
+    from helly_ai.infrastructure.vectorstores.chroma_store import ChromaVectorStore
+
+    class FlatEmbedder:
+        def embed_texts(self, texts):
+            return [[1.0, 0.0] for _ in texts]
+
+    vs = ChromaVectorStore(FlatEmbedder(), str(tmp_path / ".chroma"))
+    vs.upsert_member_corpus("lisa", [_item("1", "2024-05-31T23:59:59Z"), _item("2", "2024-06-01T00:00:00Z"), _item("3", "2024-07-01T00:00:00Z")])
+    assert [r.id for r in vs.list_items("lisa", period_bounds("2024-06"))] == ["2"]
+    assert len(vs.list_items("lisa")) == 3
+
+
+def test_refresh_includes_chroma_items_stored_before_created_ts(tmp_path: Path):
+    from helly_ai.infrastructure.vectorstores.chroma_store import ChromaVectorStore
+
+    class FlatEmbedder:
+        def embed_texts(self, texts):
+            return [[1.0, 0.0] for _ in texts]
+
+    path = str(tmp_path / ".chroma")
+    legacy = ChromaVectorStore(FlatEmbedder(), path)._collection("lisa")
+    legacy.add(
+        ids=["1", "2"],
+        documents=["note 1", "note 2"],
+        metadatas=[{"created_at": "2024-06-03T10:00:00Z"}, {"created_at": "2024-06-12T10:00:00Z"}],
+        embeddings=[[1.0, 0.0], [1.0, 0.0]],
+    )
+
+    vs, llm = ChromaVectorStore(FlatEmbedder(), path), RecordingLLM()
+    store = SqliteSummaryStore(str(tmp_path / "s.sqlite3"))
+    summaries = MemberSummaryService(vs, llm, store, debounce_s=0)
+    vs.upsert_member_corpus("lisa", [_item("3", "2024-06-20T10:00:00Z")])
+    summaries.refresh("lisa", ["2024-06"])
+    assert [(s.period, s.item_count) for s in store.list("lisa")] == [("2024-06", 3)]
+    assert all(m["created_ts"] for m in legacy.get(include=["metadatas"])["metadatas"])
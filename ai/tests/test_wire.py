@@ -0,0 +1,74 @@
+import json
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.exceptions import RequestValidationError
+
+from helly_ai.api import wire
+from helly_ai.api.schemas import IngestRequest, request_body
+
+
+ROWS = [
+    {"id": "1", "content": "Max did great", "created_at": "2024-01-01T00:00:00Z"},
+    {"id": "2", "content": "Max was late", "created_at": "2024-01-02T00:00:00Z"},
+]
+
+
+def test_rows_and_columns_parse_to_the_same_items():
+    columns = {k: [r[k] for r in ROWS] for k in ("id", "content", "created_at")}
+    by_rows = wire.parse_ingest({"team_member_ref": "max", "items": ROWS})
+    by_cols = wire.parse_ingest({"team_member_ref": "max", "items": columns})
+    assert [i._asdict() for i in by_rows["items"]] == [i._asdict() for i in by_cols["items"]] == ROWS
+    assert by_rows["wipe_existing"] is True and by_rows["from_"] is None
+
+
+def test_scalar_fields_coerce_like_the_model():
+    for raw, expected in (("false", False), (0, False), ("yes", True), (1, True)):
+        parsed = wire.parse_ingest({"team_member_ref": "max", "items": ROWS, "wipe_existing": raw})
+        model = IngestRequest.model_validate({"team_member_ref": "max", "items": ROWS, "wipe_existing": raw})
+        assert parsed["wipe_existing"] is model.wipe_existing is expected
+    with pytest.raises(RequestValidationError) as exc:
+        wire.parse_ingest({"team_member_ref": "max", "items": ROWS, "wipe_existing": "maybe"})
+    assert [e["loc"] for e in exc.value.errors()] == [("body", "wipe_existing")]
+    with pytest.raises(RequestValidationError) as exc:
+        wire.parse_ingest({"team_member_ref": "max"})
+    assert [e["loc"] for e in exc.value.errors()] == [("body", "items")]
+
+
+def test_invalid_items_report_pydantic_style_locations():
+    with pytest.raises(RequestValidationError) as exc:
+        wire.parse_ingest({"team_member_ref": "max", "items": [{"id": "1", "content": 3, "created_at": "x"}]})
+    assert [e["loc"] for e in exc.value.errors()] == [("body", "items", 0, "content")]
+    with pytest.raises(RequestValidationError):
+        wire.parse_items({"id": ["1"], "content": [], "created_at": ["x"]})
+
+
+@pytest.mark.skipif(wire.msgpack is None, reason="msgpack not installed")
+def test_msgpack_roundtrip_and_negotiation():
+    body = wire.msgpack.packb({"team_member_ref": "max", "items": ROWS})
+    assert wire.decode_body(body, "application/msgpack")["items"] == ROWS
+    resp = wire.encode_response({"answer": "ok"}, "application/msgpack, application/json;q=0.5")
+    assert resp.media_type == "application/msgpack"
+    assert wire.msgpack.unpackb(resp.body) == {"answer": "ok"}
+
+
+def test_json_stays_default():
+    assert wire.decode_body(json.dumps({"a": 1}).encode(), "application/json; charset=utf-8") == {"a": 1}
+    resp = wire.encode_response({"answer": "ok"}, None)
+    assert resp.media_type == "application/json"
+    assert json.loads(resp.body) == {"answer": "ok"}
+
+
+def test_raw_request_handlers_still_publish_the_body_schema():
+    app = FastAPI()
+
+    @app.post("/ingest", openapi_extra=request_body(IngestRequest))
+    async def ingest(request: Request):
+        return {}
+
+    body = app.openapi()["paths"]["/ingest"]["post"]["requestBody"]
+    schema = body["content"]["application/json"]["schema"]
+    assert set(body["content"]) == {"application/json", "application/msgpack"}
+    assert schema["required"] == ["team_member_ref", "items"]
+    assert schema["properties"]["items"]["items"]["properties"]["content"]["type"] == "string"
+    assert "$ref" not in json.dumps(schema)
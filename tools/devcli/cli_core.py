@@ -1,25 +1,30 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import csv
 import json
 import os
+import random
 import signal
 import sqlite3
 import subprocess
 import sys
 import time
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 import socket
 import threading
+import uuid
 
 # Paths and defaults
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
 APP_DIR = os.path.join(ROOT, "app")
 AI_DIR = os.path.join(ROOT, "ai")
 DEFAULT_APP_URL = os.getenv("APP_URL", "http://localhost:8080")
+DEFAULT_AI_URL = os.getenv("AI_URL", "http://localhost:8001")
 # Fixed dev ports
 APP_PORT = 8080
 AI_PORT = 8001
@@ -77,17 +82,22 @@ def _drain(name: str, proc: subprocess.Popen):
 
 # ----- HTTP helpers -----
 
-def http_post(path: str, body: dict, base_url: Optional[str] = None):
-    url = (base_url or DEFAULT_APP_URL).rstrip("/") + path
+def post_json(url: str, body: dict, timeout: Optional[float] = None):
+    """POST a JSON body and decode the reply. Raises on HTTP/network errors."""
     data = json.dumps(body).encode("utf-8")
     req = Request(url, data=data, headers={"Content-Type": "application/json"}, method="POST")
+    with urlopen(req, timeout=timeout) as resp:
+        payload = resp.read().decode("utf-8")
     try:
-        with urlopen(req) as resp:
-            payload = resp.read().decode("utf-8")
-            try:
-                return json.loads(payload)
-            except json.JSONDecodeError:
-                return {"raw": payload}
+        return json.loads(payload)
+    except json.JSONDecodeError:
+        return {"raw": payload}
+
+
+def http_post(path: str, body: dict, base_url: Optional[str] = None):
+    url = (base_url or DEFAULT_APP_URL).rstrip("/") + path
+    try:
+        return post_json(url, body)
     except HTTPError as e:
         print(f"HTTP {e.code} calling {url}: {e.read().decode('utf-8')}")
         sys.exit(1)
@@ -116,6 +126,35 @@ def http_get(path: str, query: dict | None = None, base_url: Optional[str] = Non
         sys.exit(1)
 
 
+def http_download(url: str, out_path: str) -> dict:
+    """Stream a binary GET response to out_path; returns the response headers."""
+    try:
+        with urlopen(Request(url, method="GET")) as resp, open(out_path, "wb") as f:
+            while chunk := resp.read(1024 * 1024):
+                f.write(chunk)
+            return dict(resp.headers)
+    except HTTPError as e:
+        print(f"HTTP {e.code} calling {url}: {e.read().decode('utf-8')}")
+        sys.exit(1)
+    except URLError as e:
+        print(f"Error calling {url}: {e}")
+        sys.exit(1)
+
+
+def http_upload(url: str, in_path: str):
+    """POST a file as application/octet-stream and decode the JSON reply."""
+    headers = {"Content-Type": "application/octet-stream", "Content-Length": str(os.path.getsize(in_path))}
+    try:
+        with open(in_path, "rb") as f, urlopen(Request(url, data=f, headers=headers, method="POST")) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+    except HTTPError as e:
+        print(f"HTTP {e.code} calling {url}: {e.read().decode('utf-8')}")
+        sys.exit(1)
+    except URLError as e:
+        print(f"Error calling {url}: {e}")
+        sys.exit(1)
+
+
 def is_port_free(port: int, host: str = "127.0.0.1") -> bool:
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
         s.settimeout(0.5)
@@ -194,6 +233,21 @@ def cmd_wipe(args):
         sys.exit(1)
 
 
+def cmd_snapshot_export(args):
+    url = args.ai_url.rstrip("/") + "/v1/admin/snapshot?" + urlencode({"compress": str(not args.no_compress).lower()})
+    started = time.monotonic()
+    headers = http_download(url, args.out)
+    print(f"Wrote {headers.get('X-Item-Count', '?')} items ({os.path.getsize(args.out)} bytes) "
+          f"to {args.out} in {time.monotonic() - started:.1f}s")
+
+
+def cmd_snapshot_import(args):
+    started = time.monotonic()
+    resp = http_upload(args.ai_url.rstrip("/") + "/v1/admin/snapshot", args.input)
+    print(json.dumps(resp, indent=2))
+    print(f"Imported in {time.monotonic() - started:.1f}s")
+
+
 def cmd_create_member(args):
     payload = {
         "name": args.name,
@@ -227,3 +281,322 @@ def cmd_list_feedback(args):
     resp = http_get("/v1/feedback", query, args.base_url)
     print(json.dumps(resp, indent=2))
 
+
+
+# ----- Bulk import -----
+
+SYNTHETIC_NAMES = ["Max", "Lisa", "Anna", "Jonas", "Mia", "Leon", "Sara", "Paul", "Emma", "Noah"]
+SYNTHETIC_ROLES = ["Engineer", "Senior Engineer", "Designer", "Product Manager", "QA Engineer"]
+SYNTHETIC_FEEDBACK = [
+    "{name} improved the API performance significantly.",
+    "{name} struggled with communication during the sprint review.",
+    "{name} mentored a new joiner on the deployment pipeline.",
+    "{name} shipped the onboarding flow ahead of schedule.",
+    "{name} missed two stand-ups this week without notice.",
+    "{name} gave a clear and well received demo to stakeholders.",
+    "{name} should take more ownership of code reviews.",
+    "{name} handled the production incident calmly and wrote a good postmortem.",
+]
+
+
+def read_records(path: str) -> Iterator[dict]:
+    """Stream records from a .csv (header row) or JSONL file, skipping empty values/lines."""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                yield {k: v for k, v in row.items() if v not in (None, "")}
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+
+
+def batched(records: Iterable[dict], size: int) -> Iterator[List[dict]]:
+    batch: List[dict] = []
+    for rec in records:
+        batch.append(rec)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _pick(rec: dict, *keys: str):
+    for k in keys:
+        if rec.get(k) not in (None, ""):
+            return rec[k]
+    return None
+
+
+def synthetic_members(count: int, seed: int) -> Iterator[dict]:
+    rng = random.Random(seed)
+    for i in range(count):
+        name = f"{SYNTHETIC_NAMES[i % len(SYNTHETIC_NAMES)]} Synthetic{i}"
+        yield {
+            "ref": f"syn-m{i}",
+            "name": name,
+            "role": rng.choice(SYNTHETIC_ROLES),
+            "relationship": "reports",
+            "startDate": f"20{rng.randint(18, 24)}-{rng.randint(1, 12):02d}-01",
+        }
+
+
+def synthetic_feedback(count: int, members: int, seed: int, by_ref: bool = True) -> Iterator[dict]:
+    """
+    Deterministic feedback spread over ~2 years; ids are stable so re-runs upsert instead of duplicating.
+    by_ref points rows at synthetic member refs (members created by this import); otherwise
+    the synthetic ids are used directly as member ids (/ai-only imports).
+    """
+    rng = random.Random(seed + 1)
+    start = time.mktime((2023, 1, 1, 0, 0, 0, 0, 0, -1))
+    for i in range(count):
+        m = rng.randrange(members)
+        name = SYNTHETIC_NAMES[m % len(SYNTHETIC_NAMES)]
+        ts = start + rng.randrange(2 * 365 * 24 * 3600)
+        yield {
+            "id": f"syn-{seed}-{i}",
+            ("member" if by_ref else "member_id"): f"syn-m{m}",
+            "content": rng.choice(SYNTHETIC_FEEDBACK).format(name=name),
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(ts)),
+        }
+
+
+class ImportCheckpoint:
+    """
+    JSON checkpoint of completed batch numbers per phase, member ref -> id mappings and the rows
+    already sent from unfinished batches. Written atomically after every batch, created member and
+    sent row so an interrupted import can be resumed.
+    """
+
+    def __init__(self, path: Optional[str]):
+        self.path = path
+        self._lock = threading.Lock()
+        self.state: dict = {"phases": {}, "member_ids": {}, "rows": {}}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.state = json.load(f)
+            self.state.setdefault("rows", {})
+
+    def done(self, phase: str) -> set:
+        return set(self.state["phases"].get(phase, []))
+
+    def member_ids(self) -> Dict[str, str]:
+        return dict(self.state["member_ids"])
+
+    def has_member(self, ref: str) -> bool:
+        with self._lock:
+            return ref in self.state["member_ids"]
+
+    def add_member(self, ref: str, member_id: str):
+        with self._lock:
+            self.state["member_ids"][ref] = member_id
+            self._save()
+
+    def rows_done(self, phase: str, batch_no: int) -> set:
+        with self._lock:
+            return set(self.state["rows"].get(phase, {}).get(str(batch_no), []))
+
+    def add_row(self, phase: str, batch_no: int, row: int):
+        with self._lock:
+            self.state["rows"].setdefault(phase, {}).setdefault(str(batch_no), []).append(row)
+            self._save()
+
+    def mark(self, phase: str, batch_no: int):
+        with self._lock:
+            self.state["phases"].setdefault(phase, []).append(batch_no)
+            # Row progress is only needed while the batch is unfinished
+            self.state["rows"].get(phase, {}).pop(str(batch_no), None)
+            self._save()
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(tmp, self.path)
+
+
+def _never_sent(e: BaseException) -> bool:
+    # Connection refused / DNS failure: the server cannot have processed the request
+    reason = e.reason if isinstance(e, URLError) else e
+    return isinstance(reason, (ConnectionRefusedError, socket.gaierror))
+
+
+def with_retries(fn: Callable[[], object], retries: int, backoff: float = 0.5, idempotent: bool = True):
+    """
+    Retry transient failures with exponential backoff and jitter.
+    Idempotent calls retry on network errors, timeouts, 429 and 5xx. Non-idempotent calls (creates)
+    only retry when the request was certainly not processed (429, connection refused), since a
+    timeout or 5xx may come after the server already created the record.
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn()
+        except HTTPError as e:
+            transient = e.code == 429 or (idempotent and e.code >= 500)
+            if not transient or attempt >= retries:
+                raise
+        except (URLError, OSError) as e:
+            if not (idempotent or _never_sent(e)) or attempt >= retries:
+                raise
+        time.sleep(backoff * (2 ** attempt) * (1 + random.random()))
+        attempt += 1
+
+
+class _Progress:
+    def __init__(self, phase: str):
+        self.phase = phase
+        self.items = 0
+        self.started = time.monotonic()
+        self._last = 0.0
+        self._lock = threading.Lock()
+
+    def add(self, n: int):
+        with self._lock:
+            self.items += n
+            now = time.monotonic()
+            if now - self._last >= 2.0:
+                self._last = now
+                print(f"[{self.phase}] {self.items} items, {self.rate():.1f} items/s")
+
+    def rate(self) -> float:
+        return self.items / max(time.monotonic() - self.started, 1e-9)
+
+
+def run_batches(phase: str, batches: Iterable[List[dict]], send: Callable[[int, List[dict]], None],
+                ckpt: ImportCheckpoint, workers: int) -> int:
+    """
+    Send batches through a bounded worker pool, checkpointing each completed batch.
+    send gets the batch number so it can checkpoint rows within a batch.
+    Batches already recorded in the checkpoint are skipped. Returns the number of failed batches.
+    """
+    skip = ckpt.done(phase)
+    progress = _Progress(phase)
+    failed = 0
+    pending = {}
+
+    def _collect(fut):
+        nonlocal failed
+        batch_no, size = pending.pop(fut)
+        try:
+            fut.result()
+        except Exception as e:
+            failed += 1
+            print(f"[{phase}] batch {batch_no} failed: {e}")
+            return
+        ckpt.mark(phase, batch_no)
+        progress.add(size)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for batch_no, batch in enumerate(batches):
+            if batch_no in skip:
+                continue
+            pending[pool.submit(send, batch_no, batch)] = (batch_no, len(batch))
+            # Bound in-flight batches so large files are streamed, not loaded upfront
+            if len(pending) >= workers * 2:
+                _collect(next(as_completed(list(pending))))
+        for fut in as_completed(list(pending)):
+            _collect(fut)
+
+    print(f"[{phase}] done: {progress.items} items in {time.monotonic() - progress.started:.1f}s "
+          f"({progress.rate():.1f} items/s), {failed} failed batches")
+    return failed
+
+
+def cmd_import(args):
+    if not (args.members or args.feedback or args.synthetic):
+        print("Nothing to import: pass --members, --feedback and/or --synthetic N")
+        sys.exit(2)
+    ckpt = ImportCheckpoint(args.checkpoint)
+    app_url = args.base_url.rstrip("/")
+    ai_url = args.ai_url.rstrip("/")
+    failed = 0
+
+    # Members always go through /app; refs let feedback rows point at members created in this run
+    member_records: Optional[Iterable[dict]] = None
+    if args.members:
+        member_records = read_records(args.members)
+    elif args.synthetic and args.target == "app":
+        member_records = synthetic_members(args.synthetic_members, args.seed)
+
+    if member_records is not None:
+        def send_members(batch_no: int, batch: List[dict]) -> None:
+            for rec in batch:
+                ref = _pick(rec, "ref")
+                # Refs are checkpointed per created member, so a resumed batch skips them.
+                # Rows without a ref cannot be matched and may be created again on resume.
+                if ref is not None and ckpt.has_member(str(ref)):
+                    continue
+                payload = {
+                    "name": _pick(rec, "name"),
+                    "role": _pick(rec, "role"),
+                    "relationshipToManager": _pick(rec, "relationshipToManager", "relationship"),
+                    "startDate": _pick(rec, "startDate", "start_date"),
+                }
+                resp = with_retries(lambda: post_json(app_url + "/v1/team-members", payload, args.timeout),
+                                    args.retries, idempotent=False)
+                if ref is not None and isinstance(resp, dict) and resp.get("id"):
+                    ckpt.add_member(str(ref), resp["id"])
+
+        failed += run_batches("members", batched(member_records, args.batch_size), send_members, ckpt, args.workers)
+
+    member_ids = ckpt.member_ids()
+
+    def member_of(rec: dict) -> Optional[str]:
+        # `member` is a ref into this import and must have been created; ids/hints pass through
+        ref = _pick(rec, "member")
+        if ref is not None:
+            if str(ref) not in member_ids:
+                raise ValueError(f"feedback row references member ref {ref!r} that was not created")
+            return member_ids[str(ref)]
+        return _pick(rec, "member_id", "memberId", "personHint")
+
+    def send_feedback_app(batch_no: int, batch: List[dict]) -> None:
+        # Resolve every row before posting so a bad row fails the batch before anything is created
+        payloads = []
+        for rec in batch:
+            payload = {"content": _pick(rec, "content"), "personHint": member_of(rec),
+                       "createdAt": _pick(rec, "created_at", "createdAt")}
+            payloads.append({k: v for k, v in payload.items() if v is not None})
+        # /app assigns each feedback a new id, so rows sent before a failure are checkpointed and skipped on resume
+        sent = ckpt.rows_done("feedback", batch_no)
+        for row, payload in enumerate(payloads):
+            if row in sent:
+                continue
+            with_retries(lambda: post_json(app_url + "/v1/feedback", payload, args.timeout),
+                         args.retries, idempotent=False)
+            ckpt.add_row("feedback", batch_no, row)
+
+    def send_feedback_ai(batch_no: int, batch: List[dict]) -> None:
+        # One ingest call per member in the batch; stable ids make re-sends idempotent upserts
+        by_member: Dict[str, List[dict]] = {}
+        for rec in batch:
+            member = member_of(rec)
+            if member is None:
+                raise ValueError(f"feedback row without member: {rec}")
+            content = _pick(rec, "content")
+            created_at = _pick(rec, "created_at", "createdAt") or time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            item_id = _pick(rec, "id") or str(uuid.uuid5(uuid.NAMESPACE_URL, f"{member}|{created_at}|{content}"))
+            by_member.setdefault(str(member), []).append({"id": str(item_id), "content": content, "created_at": created_at})
+        for member, items in by_member.items():
+            payload = {"team_member_ref": member, "items": items, "wipe_existing": False}
+            with_retries(lambda: post_json(ai_url + "/v1/ingest/member-corpus", payload, args.timeout), args.retries)
+
+    feedback_records: Optional[Iterable[dict]] = None
+    if args.feedback:
+        feedback_records = read_records(args.feedback)
+    elif args.synthetic:
+        feedback_records = synthetic_feedback(args.synthetic, args.synthetic_members, args.seed, by_ref=args.target == "app")
+
+    if feedback_records is not None:
+        send = send_feedback_ai if args.target == "ai" else send_feedback_app
+        failed += run_batches("feedback", batched(feedback_records, args.batch_size), send, ckpt, args.workers)
+
+    if failed:
+        print(f"{failed} batches failed; re-run with the same --checkpoint to retry them")
+        sys.exit(1)
@@ -6,6 +6,7 @@ Minimal dev CLI to run both backends and call /app APIs.
 
 Environment overrides:
 - APP_URL (default http://localhost:8080)
+- AI_URL (default http://localhost:8001)
 - AI_CMD (optional) override command to run /ai
 - APP_CMD (optional) override command to run /app
 """
@@ -14,12 +15,16 @@ from __future__ import annotations
 import argparse
 from cli_core import (
     DEFAULT_APP_URL,
+    DEFAULT_AI_URL,
     cmd_up,
     cmd_wipe,
     cmd_create_member,
     cmd_add_feedback,
     cmd_ask,
     cmd_list_feedback,
+    cmd_import,
+    cmd_snapshot_export,
+    cmd_snapshot_import,
 )
 
 
@@ -60,6 +65,34 @@ def main():
     lf.add_argument("--base-url", default=DEFAULT_APP_URL)
     lf.set_defaults(func=cmd_list_feedback)
 
+    im = sub.add_parser("import", help="Bulk import members/feedback from JSONL/CSV or synthetic data")
+    im.add_argument("--members", required=False, help="JSONL/CSV of members (name, role, relationship, startDate, ref)")
+    im.add_argument("--feedback", required=False, help="JSONL/CSV of feedback (content, member_id|member, created_at, id)")
+    im.add_argument("--synthetic", type=int, default=0, help="generate N synthetic feedback items")
+    im.add_argument("--synthetic-members", type=int, default=20)
+    im.add_argument("--seed", type=int, default=42)
+    im.add_argument("--target", choices=["app", "ai"], default="app",
+                    help="app: POST /v1/feedback per item; ai: batched POST to /ai ingest (skips /app)")
+    im.add_argument("--batch-size", type=int, default=100)
+    im.add_argument("--workers", type=int, default=8)
+    im.add_argument("--retries", type=int, default=3)
+    im.add_argument("--timeout", type=float, default=60.0, help="per-request timeout in seconds")
+    im.add_argument("--checkpoint", required=False, help="progress file; re-run with it to resume")
+    im.add_argument("--base-url", default=DEFAULT_APP_URL)
+    im.add_argument("--ai-url", default=DEFAULT_AI_URL)
+    im.set_defaults(func=cmd_import)
+
+    se = sub.add_parser("snapshot-export", help="GET /ai /v1/admin/snapshot (vector index snapshot)")
+    se.add_argument("--out", required=True)
+    se.add_argument("--no-compress", action="store_true")
+    se.add_argument("--ai-url", default=DEFAULT_AI_URL)
+    se.set_defaults(func=cmd_snapshot_export)
+
+    si = sub.add_parser("snapshot-import", help="POST /ai /v1/admin/snapshot (bulk-load, no re-embedding)")
+    si.add_argument("--in", dest="input", required=True)
+    si.add_argument("--ai-url", default=DEFAULT_AI_URL)
+    si.set_defaults(func=cmd_snapshot_import)
+
     # Utilities
     wipe = sub.add_parser("wipe", help="Clear all tables (keep schema)")
     wipe.set_defaults(func=cmd_wipe)